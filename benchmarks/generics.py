@@ -0,0 +1,110 @@
+"""
+MIT License
+
+Copyright (c) 2017 Brandon Hoffman
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+# Compares validating List[Integer], Dictionary[str, Person] and
+# Union[int, str] through the element types bound in bind_generics against
+# resolving them with get_actual_type on every call, as validate used to.
+# Run it from the root of the repository so instance can be imported.
+#
+#     python -m benchmarks.generics
+
+import timeit
+from instance.types import Schema, Integer, String, List, Dictionary, Union, T, K, V
+from instance.validators import ValidationException, SchemaValidationException
+
+class Person(Schema):
+    name: str
+    age: int
+
+class ResolvingList(List[Integer]):
+    def validate(self, _val, ctx=None):
+        for validator in self.all_validators:
+            validator(_val)
+
+        errors = []
+        actual_type = self.get_actual_type(T)
+        for (index, value) in enumerate(_val):
+            try:
+                actual_type.validate(value, ctx)
+            except ValidationException as e:
+                error = e.error()
+                error["index"] = index
+                errors.append(error)
+                if ctx is not None and ctx.spend(e):
+                    break
+
+        if errors:
+            raise SchemaValidationException(errors)
+
+class ResolvingDictionary(Dictionary[String, Person]):
+    def validate(self, _val, ctx=None):
+        for validator in self.all_validators:
+            validator(_val)
+
+        actual_key_type = self.get_actual_type(K)
+        actual_val_type = self.get_actual_type(V)
+        for (key, value) in _val.items():
+            actual_key_type(key, ctx)
+            actual_val_type(value, ctx)
+
+class ResolvingUnion(Union[Integer, String]):
+    def validate(self, _val, ctx=None):
+        errors = []
+        for generic in (T, K):
+            actual_type = self.get_actual_type(generic)
+            try:
+                actual_type(_val, ctx and ctx.branch())
+                return _val
+            except ValidationException as e:
+                errors.append(e.error())
+        raise SchemaValidationException(errors)
+
+def run(name, bound, resolved, number):
+    bound_time = min(timeit.repeat(bound, number=number, repeat=7))
+    resolved_time = min(timeit.repeat(resolved, number=number, repeat=7))
+    print("{name:<36} bound {bound:10.2f}us  per call {resolved:10.2f}us  gain {gain:5.1f}%".format(
+        name=name,
+        bound=bound_time / number * 1e6,
+        resolved=resolved_time / number * 1e6,
+        gain=(resolved_time - bound_time) / resolved_time * 100))
+
+def main():
+    integers, resolving_integers = List[Integer](), ResolvingList()
+    people, resolving_people = Dictionary[String, Person](), ResolvingDictionary()
+    union, resolving_union = Union[Integer, String](), ResolvingUnion()
+
+    for size in (1, 100, 100000):
+        value = list(range(size))
+        number = max(1, 100000 // size)
+        run("List[Integer] x {size}".format(size=size), lambda: integers.validate(value), lambda: resolving_integers.validate(value), number)
+
+    for size in (1, 100, 10000):
+        value = {str(idx): {'name': 'joe', 'age': idx} for idx in range(size)}
+        number = max(1, 10000 // size)
+        run("Dictionary[str, Person] x {size}".format(size=size), lambda: people.validate(value), lambda: resolving_people.validate(value), number)
+
+    run("Union[int, str]", lambda: union.validate("text"), lambda: resolving_union.validate("text"), 100000)
+
+if __name__ == "__main__":
+    main()
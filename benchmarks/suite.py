@@ -0,0 +1,178 @@
+"""
+MIT License
+
+Copyright (c) 2017 Brandon Hoffman
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+# Measures Schema class creation, from_json on valid and invalid payloads,
+# validate and to_json over synthetic Schemas of growing width, nesting
+# depth, list length and Union fan-out. Results are written as json and
+# can be compared against a stored baseline, failing when any benchmark
+# got slower by more than the threshold.
+# Run it from the root of the repository so instance can be imported.
+#
+#     python -m benchmarks.suite --output results.json
+#     python -m benchmarks.suite --baseline benchmarks/baseline.json --threshold 0.2
+#     python -m benchmarks.suite --save benchmarks/baseline.json
+
+import argparse
+import json
+import sys
+import timeit
+import typing
+from instance.types import Schema, Union
+from instance.validators import ValidationException
+
+field_types = [int, str, float, bool]
+field_values = [1, "text", 1.5, True]
+
+def create_schema(name, annotations, defaults={}):
+    dct = dict(defaults)
+    dct["__annotations__"] = annotations
+    dct["__module__"] = __name__
+    dct["__qualname__"] = name
+    return type(Schema)(name, (Schema,), dct)
+
+def wide(width):
+    annotations = {"field{idx}".format(idx=idx): field_types[idx % 4] for idx in range(width)}
+    payload = {"field{idx}".format(idx=idx): field_values[idx % 4] for idx in range(width)}
+    invalid = dict(payload, field0=None)
+    return (lambda: create_schema("Wide", annotations)), payload, invalid
+
+def deep(depth):
+    def create():
+        schema = create_schema("Leaf", {"value": int})
+        for level in range(depth):
+            schema = create_schema("Level{level}".format(level=level), {"value": int, "child": schema})
+        return schema
+    payload = {"value": 1}
+    for level in range(depth):
+        payload = {"value": level, "child": payload}
+    invalid = json.loads(json.dumps(payload))
+    innermost = invalid
+    while "child" in innermost:
+        innermost = innermost["child"]
+    innermost["value"] = "1"
+    return create, payload, invalid
+
+def long(length):
+    def create():
+        item = create_schema("Item", {"name": str, "count": int})
+        return create_schema("Items", {"items": typing.List[item]})
+    payload = {"items": [{"name": "item", "count": idx} for idx in range(length)]}
+    invalid = {"items": payload["items"][:-1] + [{"name": None, "count": 1}]}
+    return create, payload, invalid
+
+def fanout(branches, discriminator=None):
+    def create():
+        schemas = tuple(create_schema("Branch{idx}".format(idx=idx), {"kind": str, "value": int}, {"kind": "b{idx}".format(idx=idx)}) for idx in range(branches))
+        union = Union[schemas]
+        if discriminator is not None:
+            union = union(discriminator=discriminator)
+        return create_schema("Fanout", {"item": union})
+    last = "b{idx}".format(idx=branches - 1)
+    payload = {"item": {"kind": last, "value": 1}}
+    invalid = {"item": {"kind": last, "value": "1"}}
+    return create, payload, invalid
+
+scenarios = [
+    ("width {size}".format(size=size), wide(size)) for size in (10, 100, 500)
+] + [
+    ("depth {size}".format(size=size), deep(size)) for size in (1, 5, 20)
+] + [
+    ("list {size}".format(size=size), long(size)) for size in (10, 1000)
+] + [
+    ("union {size}".format(size=size), fanout(size)) for size in (2, 8, 32)
+] + [
+    ("tagged union {size}".format(size=size), fanout(size, "kind")) for size in (2, 8, 32)
+]
+
+def measure(func, repeat):
+    number, _ = timeit.Timer(func).autorange()
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e6
+
+def fails(schema, payload):
+    def run():
+        try:
+            schema.from_json(payload)
+        except ValidationException:
+            return
+        raise AssertionError("invalid payload was accepted")
+    return run
+
+def run(repeat):
+    results = {}
+    for (name, (create, payload, invalid)) in scenarios:
+        schema = create()
+        obj = schema.from_json(payload)
+        fails(schema, invalid)()
+        results[name + " create"] = measure(create, repeat)
+        results[name + " from_json"] = measure(lambda: schema.from_json(payload), repeat)
+        results[name + " from_json invalid"] = measure(fails(schema, invalid), repeat)
+        results[name + " validate"] = measure(obj.validate, repeat)
+        results[name + " validate full"] = measure(lambda: obj.validate(full=True), repeat)
+        results[name + " to_json"] = measure(obj.to_json, repeat)
+        for key in list(results)[-6:]:
+            print("{name:<40} {time:12.2f}us".format(name=key, time=results[key]))
+    return results
+
+def compare(results, baseline, threshold):
+    regressions = []
+    for (name, time) in sorted(baseline.items()):
+        if name not in results:
+            continue
+        change = (results[name] - time) / time
+        if change > threshold:
+            regressions.append(name)
+        print("{name:<40} {baseline:12.2f}us {current:12.2f}us {change:+7.1f}%".format(
+            name=name,
+            baseline=time,
+            current=results[name],
+            change=change * 100))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="instance benchmark suite")
+    parser.add_argument("--output", help="write the results to this json file")
+    parser.add_argument("--save", help="store the results as the new baseline")
+    parser.add_argument("--baseline", help="compare the results against this baseline")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown before failing, 0.2 is 20%%")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    results = run(args.repeat)
+    for path in (args.output, args.save):
+        if path:
+            with open(path, "w") as f:
+                json.dump(results, f, indent=4, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print("slower than the baseline by more than {threshold:.0%}:".format(threshold=args.threshold))
+            for name in regressions:
+                print("    " + name)
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
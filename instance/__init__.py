@@ -24,3 +24,4 @@ SOFTWARE.
 
 import instance.types
 import instance.validators
+from instance.types import finalize_all
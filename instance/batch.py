@@ -0,0 +1,147 @@
+"""
+MIT License
+
+Copyright (c) 2017 Brandon Hoffman
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from instance.validators import NoneTypeValidator, TypesValidator, MaxValidator, MinValidator, MaxLengthValidator, MinLengthValidator, ValidationException
+from instance.compiler import inlinable
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+def none_failures(validator, column, indexes):
+    return [idx for idx in indexes if column[idx] is None]
+
+def types_failures(validator, column, indexes):
+    types = validator.types
+    return [idx for idx in indexes if type(column[idx]) not in types]
+
+def compare(values, indexes, limit, operator):
+    if numpy is not None and values:
+        array = numpy.array(values)
+        if array.dtype.kind in "if":
+            mask = operator(array, limit)
+            return [indexes[position] for position in numpy.nonzero(mask)[0]]
+    return [indexes[position] for (position, value) in enumerate(values) if operator(value, limit)]
+
+def greater(value, limit):
+    return value > limit
+
+def greater_equal(value, limit):
+    return value >= limit
+
+def less(value, limit):
+    return value < limit
+
+def less_equal(value, limit):
+    return value <= limit
+
+def value_failures(measure, operator, inclusive_operator):
+    def failures(validator, column, indexes):
+        if measure is None:
+            values = [column[idx] for idx in indexes]
+        else:
+            values = [measure(column[idx]) for idx in indexes]
+        op = validator.inclusive and operator or inclusive_operator
+        return compare(values, indexes, validator.limit, op)
+    return failures
+
+def exception_of(validator):
+    return getattr(validator, "exception", None) or validator.none_type_exception
+
+column_checks = {
+    NoneTypeValidator: none_failures,
+    TypesValidator: types_failures,
+    MaxValidator: value_failures(None, greater, greater_equal),
+    MinValidator: value_failures(None, less, less_equal),
+    MaxLengthValidator: value_failures(len, greater, greater_equal),
+    MinLengthValidator: value_failures(len, less, less_equal),
+}
+
+def record_error(errors, idx, key, error):
+    record_errors = errors.get(idx)
+    if record_errors is None:
+        record_errors = errors[idx] = {}
+    record_errors[key] = error
+
+def from_json_many(schema_type, records):
+    schema = schema_type.schema
+    records = list(records)
+    errors = {}
+    indexes = []
+    valid = []
+    for (idx, record) in enumerate(records):
+        for check in schema_type.checks:
+            error = check(record)
+            if error is not None:
+                errors[idx] = error.error()
+                break
+        else:
+            indexes.append(idx)
+            valid.append(record)
+
+    positions = range(len(valid))
+    failed = set()
+    columns = []
+    for (key, type) in schema.__annotations__.items():
+        default = schema._defaults[key] if key in schema._defaults else getattr(schema, key, None)
+        column = [record[key] if key in record else default for record in valid]
+
+        validators = inlinable(type)
+        if validators is None and type.returns_input():
+            check = type.check
+            for position in positions:
+                error = check(column[position])
+                if error is not None:
+                    record_error(errors, indexes[position], key, error.error())
+                    failed.add(position)
+        elif validators is None:
+            for position in positions:
+                try:
+                    column[position] = type(column[position])
+                except ValidationException as e:
+                    record_error(errors, indexes[position], key, e.error())
+                    failed.add(position)
+        else:
+            pending = positions
+            for validator in validators:
+                failures = column_checks[validator.__class__](validator, column, pending)
+                if failures:
+                    error = exception_of(validator).error
+                    for position in failures:
+                        record_error(errors, indexes[position], key, error())
+                    failed.update(failures)
+                    rejected = set(failures)
+                    pending = [position for position in pending if position not in rejected]
+        columns.append(column)
+
+    objects = [None] * len(records)
+    build = schema_type.builder
+    for (position, row) in enumerate(zip(*columns)):
+        if position not in failed:
+            objects[indexes[position]] = build(*row)
+    if not columns:
+        for idx in indexes:
+            objects[idx] = build()
+    return objects, errors
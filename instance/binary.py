@@ -0,0 +1,381 @@
+"""
+MIT License
+
+Copyright (c) 2017 Brandon Hoffman
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import hashlib
+import json
+import struct
+import instance.serialize
+import instance.types
+from instance.compiler import Namespace, build, read
+from instance.lazy import LazyList, LazyDict
+from instance.validators import Validator, ValidationException, validator_key
+
+length = struct.Struct("<I")
+double = struct.Struct("<d")
+big = -2 ** 63
+fingerprint_size = 8
+fingerprint_exception = ValidationException(5, "schema fingerprint mismatch")
+invalid_exception = ValidationException(5, "invalid binary data")
+
+def encode_int(val, out):
+    size = (val.bit_length() + 8) >> 3
+    out.append(size)
+    out += val.to_bytes(size, "little", signed=True)
+
+def decode_int(buf, pos):
+    end = pos + 1 + buf[pos]
+    return int.from_bytes(buf[pos + 1:end], "little", signed=True), end
+
+def encode_str(val, out):
+    data = val.encode("utf-8")
+    out += length.pack(len(data))
+    out += data
+
+def decode_str(buf, pos):
+    end = pos + 4 + length.unpack_from(buf, pos)[0]
+    return str(buf[pos + 4:end], "utf-8"), end
+
+def encode_bool(val, out):
+    out.append(val is True)
+
+def decode_bool(buf, pos):
+    return buf[pos] == 1, pos + 1
+
+def encode_double(val, out):
+    out += double.pack(val)
+
+def decode_double(buf, pos):
+    return double.unpack_from(buf, pos)[0], pos + 8
+
+def encode_json(val, out):
+    encode_str(instance.serialize.to_json_string(val), out)
+
+def decode_json(buf, pos):
+    text, pos = decode_str(buf, pos)
+    return json.loads(text), pos
+
+scalars = {
+    (int,): ("q", encode_int, decode_int),
+    (str,): (None, encode_str, decode_str),
+    (bool,): ("?", encode_bool, decode_bool),
+    (float, int): ("d", encode_double, decode_double),
+}
+
+def scalar(field_type):
+    inline_validators = getattr(field_type, "inline_validators", None)
+    if inline_validators is None or inline_validators() is None:
+        return None
+    types = instance.types.accepted_types(field_type)
+    return types and scalars.get(tuple(types))
+
+def list_codec(item_type):
+    encode_item, decode_item = codec(item_type)
+    def encode(val, out):
+        if type(val) is LazyList:
+            val = val.shallow()
+        out += length.pack(len(val))
+        for item in val:
+            encode_item(item, out)
+    def decode(buf, pos):
+        count = length.unpack_from(buf, pos)[0]
+        pos += 4
+        items = []
+        for _ in range(count):
+            item, pos = decode_item(buf, pos)
+            items.append(item)
+        return items, pos
+    return encode, decode
+
+def dict_codec(key_type, value_type):
+    encode_key, decode_key = codec(key_type)
+    encode_value, decode_value = codec(value_type)
+    def encode(val, out):
+        if type(val) is LazyDict:
+            val = val.shallow()
+        out += length.pack(len(val))
+        for (key, value) in val.items():
+            encode_key(key, out)
+            encode_value(value, out)
+    def decode(buf, pos):
+        count = length.unpack_from(buf, pos)[0]
+        pos += 4
+        items = {}
+        for _ in range(count):
+            key, pos = decode_key(buf, pos)
+            items[key], pos = decode_value(buf, pos)
+        return items, pos
+    return encode, decode
+
+def optional_codec(item_type):
+    encode_item, decode_item = codec(item_type)
+    def encode(val, out):
+        if val is None:
+            out.append(0)
+        else:
+            out.append(1)
+            encode_item(val, out)
+    def decode(buf, pos):
+        if buf[pos] == 0:
+            return None, pos + 1
+        return decode_item(buf, pos + 1)
+    return encode, decode
+
+def branch_index(union, val):
+    if getattr(val, "is_schema", False):
+        for (index, branch) in enumerate(union.branches):
+            if getattr(branch, "schema", None) is type(val):
+                return index
+    elif union.discriminator is not None and isinstance(val, dict):
+        branch = union.tagged(val)
+        if branch is not None:
+            return union.branches.index(branch)
+    else:
+        for (index, branch) in enumerate(union.branches):
+            if branch.check(val) is None:
+                return index
+    raise union.check(val) or TypeError("{val!r} does not match {union}".format(val=val, union=union))
+
+def union_codec(union):
+    branches = [codec(branch) for branch in union.branches]
+    def encode(val, out):
+        index = branch_index(union, val)
+        out.append(index)
+        branches[index][0](val, out)
+    def decode(buf, pos):
+        return branches[buf[pos]][1](buf, pos + 1)
+    return encode, decode
+
+def codec(field_type, build=False):
+    if getattr(field_type, "schema", None) is not None:
+        return schema_codec(field_type, build)
+    if isinstance(field_type, instance.types.Union):
+        return union_codec(field_type)
+    if isinstance(field_type, instance.types.Optional):
+        return optional_codec(field_type.item_type)
+    if isinstance(field_type, instance.types.List):
+        return list_codec(field_type.item_type)
+    if isinstance(field_type, instance.types.Dictionary):
+        return dict_codec(field_type.key_type, field_type.value_type)
+    found = scalar(field_type)
+    if found is None:
+        return encode_json, decode_json
+    return found[1:]
+
+def encode_lines(value, field_type, names, build=False):
+    if scalar(field_type) is scalars[(str,)]:
+        return [
+            "data = {value}.encode('utf-8')".format(value=value),
+            "out += pack_length(len(data))",
+            "out += data",
+        ]
+    return ["{encode}({value}, out)".format(encode=names(codec(field_type, build)[0], "_e"), value=value)]
+
+def decode_lines(value, field_type, names, build=False):
+    if scalar(field_type) is scalars[(str,)]:
+        return [
+            "end = pos + 4 + unpack_length(buf, pos)[0]",
+            "{value} = str(buf[pos + 4:end], 'utf-8')".format(value=value),
+            "pos = end",
+        ]
+    return ["{value}, pos = {decode}(buf, pos)".format(value=value, decode=names(codec(field_type, build)[1], "_d"))]
+
+def fixed_fields(fields):
+    fixed = []
+    for (idx, (key, type)) in enumerate(fields):
+        found = scalar(type)
+        if found is not None and found[0] is not None:
+            fixed.append((idx, found[0]))
+    return fixed
+
+def compile_encode_object(schema_type, names):
+    schema = schema_type.schema
+    fields = list(schema.__annotations__.items())
+    fixed = fixed_fields(fields)
+    lines = ["def encode(obj, out):"]
+    lines += ["    _{idx} = {value}".format(idx=idx, value=read(key)) for (idx, (key, type)) in enumerate(fields)]
+    if fixed:
+        overflow = [idx for (idx, code) in fixed if code == "q"]
+        if overflow:
+            lines.append("    tail = None")
+        for idx in overflow:
+            lines += [
+                "    if not {big} < _{idx} < {limit}:".format(big=big, idx=idx, limit=-big),
+                "        if tail is None:",
+                "            tail = bytearray()",
+                "        encode_int(_{idx}, tail)".format(idx=idx),
+                "        _{idx} = {big}".format(idx=idx, big=big),
+            ]
+        run = struct.Struct("<" + "".join(code for (idx, code) in fixed))
+        lines.append("    out += {run}(*({values}))".format(run=names(run.pack, "_s"), values="".join("_{idx}, ".format(idx=idx) for (idx, code) in fixed)))
+        if overflow:
+            lines += [
+                "    if tail is not None:",
+                "        out += tail",
+            ]
+    fixed_indexes = {idx for (idx, code) in fixed}
+    for (idx, (key, type)) in enumerate(fields):
+        if idx not in fixed_indexes:
+            lines += ["    " + line for line in encode_lines("_{idx}".format(idx=idx), type, names, build=True)]
+    return build("encode", schema, names, lines)
+
+def compile_decode_object(schema_type, names):
+    schema = schema_type.schema
+    fields = list(schema.__annotations__.items())
+    fixed = fixed_fields(fields)
+    lines = ["def decode(buf, pos):"]
+    if fixed:
+        run = struct.Struct("<" + "".join(code for (idx, code) in fixed))
+        lines += [
+            "    {values}, = {run}(buf, pos)".format(values=", ".join("_{idx}".format(idx=idx) for (idx, code) in fixed), run=names(run.unpack_from, "_s")),
+            "    pos += {size}".format(size=run.size),
+        ]
+        for (idx, code) in fixed:
+            if code == "q":
+                lines += [
+                    "    if _{idx} == {big}:".format(idx=idx, big=big),
+                    "        _{idx}, pos = decode_int(buf, pos)".format(idx=idx),
+                ]
+    fixed_indexes = {idx for (idx, code) in fixed}
+    for (idx, (key, type)) in enumerate(fields):
+        if idx not in fixed_indexes:
+            lines += ["    " + line for line in decode_lines("_{idx}".format(idx=idx), type, names, build=True)]
+    lines.append("    return {builder}(*({values})), pos".format(builder=names(schema_type.builder, "_b"), values="".join("_{idx}, ".format(idx=idx) for idx in range(len(fields)))))
+    return build("decode", schema, names, lines)
+
+def compile_encode_dict(schema_type, names):
+    schema = schema_type.schema
+    fields = list(schema.__annotations__.items())
+    size = (len(fields) + 7) >> 3
+    lines = [
+        "def encode(val, out):",
+        "    if not isinstance(val, dict):",
+        "        val = fields(val)",
+        "    mask = 0",
+        "    start = len(out)",
+        "    out += bytes({size})".format(size=size),
+    ]
+    for (idx, (key, type)) in enumerate(fields):
+        lines += [
+            "    if {key!r} in val:".format(key=key),
+            "        mask |= {bit}".format(bit=1 << idx),
+        ]
+        lines += ["        " + line for line in encode_lines("val[{key!r}]".format(key=key), type, names)]
+    lines.append("    out[start:start + {size}] = mask.to_bytes({size}, 'little')".format(size=size))
+    return build("encode", schema, names, lines)
+
+def compile_decode_dict(schema_type, names):
+    schema = schema_type.schema
+    fields = list(schema.__annotations__.items())
+    size = (len(fields) + 7) >> 3
+    lines = [
+        "def decode(buf, pos):",
+        "    val = {}",
+        "    mask = int.from_bytes(buf[pos:pos + {size}], 'little')".format(size=size),
+        "    pos += {size}".format(size=size),
+    ]
+    for (idx, (key, type)) in enumerate(fields):
+        lines.append("    if mask & {bit}:".format(bit=1 << idx))
+        lines += ["        " + line for line in decode_lines("val[{key!r}]".format(key=key), type, names)]
+    lines.append("    return val, pos")
+    return build("decode", schema, names, lines)
+
+def codec_names(schema_type):
+    return Namespace(fields=schema_type.fields, pack_length=length.pack, unpack_length=length.unpack_from, encode_int=encode_int, decode_int=decode_int)
+
+def placeholder(compiled):
+    def encode(val, out):
+        return compiled[0](val, out)
+    def decode(buf, pos):
+        return compiled[1](buf, pos)
+    return encode, decode
+
+def schema_codec(schema_type, build=False):
+    codecs = schema_type.codecs
+    if build not in codecs:
+        compiled = []
+        codecs[build] = placeholder(compiled)
+        try:
+            if build:
+                compiled += [compile_encode_object(schema_type, codec_names(schema_type)), compile_decode_object(schema_type, codec_names(schema_type))]
+            else:
+                compiled += [compile_encode_dict(schema_type, codec_names(schema_type)), compile_decode_dict(schema_type, codec_names(schema_type))]
+        except Exception:
+            del codecs[build]
+            raise
+        codecs[build] = tuple(compiled)
+    return codecs[build]
+
+def describe_validator(validator):
+    key = validator_key(validator)
+    if key[0] is Validator:
+        named = validator if hasattr(validator, "__qualname__") else validator.__class__
+        return "{module}.{name}".format(module=named.__module__, name=named.__qualname__)
+    return "{name}{args!r}".format(name=key[0].__name__, args=key[1:])
+
+def describe(field_type, memo=None):
+    if memo is None:
+        memo = {}
+    validators = ",".join(describe_validator(validator) for validator in getattr(field_type, "all_validators", ()))
+    schema = getattr(field_type, "schema", None)
+    if schema is not None:
+        if field_type in memo:
+            return memo[field_type] or "^{name}".format(name=schema.__qualname__)
+        memo[field_type] = None
+        fields = ",".join("{key}:{type}".format(key=key, type=describe(type, memo)) for (key, type) in schema.__annotations__.items())
+        memo[field_type] = "{name}({validators}){{{fields}}}".format(name=schema.__qualname__, validators=validators, fields=fields)
+        return memo[field_type]
+    if isinstance(field_type, instance.types.Union):
+        params = [describe(branch, memo) for branch in field_type.branches]
+        params.append(repr(field_type.discriminator))
+    elif isinstance(field_type, instance.types.Dictionary):
+        params = [describe(field_type.key_type, memo), describe(field_type.value_type, memo)]
+    elif isinstance(field_type, (instance.types.List, instance.types.Optional)):
+        params = [describe(field_type.item_type, memo)]
+    else:
+        params = []
+    return "{name}({validators})[{params}]".format(name=field_type.__class__.__qualname__, validators=validators, params=",".join(params))
+
+def fingerprint(schema_type):
+    if schema_type.fingerprint is None:
+        schema_type.fingerprint = hashlib.sha1(describe(schema_type).encode("utf-8")).digest()[:fingerprint_size]
+    return schema_type.fingerprint
+
+def to_bytes(schema_type, obj):
+    out = bytearray(fingerprint(schema_type))
+    schema_codec(schema_type, build=True)[0](obj, out)
+    return bytes(out)
+
+def from_bytes(schema_type, buf, trusted=True):
+    buf = memoryview(buf)
+    if buf[:fingerprint_size] != fingerprint(schema_type):
+        raise fingerprint_exception
+    try:
+        obj, pos = schema_codec(schema_type, build=True)[1](buf, fingerprint_size)
+    except (IndexError, KeyError, struct.error, UnicodeDecodeError, ValueError, OverflowError):
+        raise invalid_exception
+    if pos != len(buf):
+        raise invalid_exception
+    if not trusted:
+        obj.validate(full=True)
+    return obj
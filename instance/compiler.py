@@ -0,0 +1,340 @@
+"""
+MIT License
+
+Copyright (c) 2017 Brandon Hoffman
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from instance.lazy import LazyList, LazyDict
+from instance.serialize import encode
+from instance.validators import NoneTypeValidator, TypesValidator, MaxValidator, MinValidator, MaxLengthValidator, MinLengthValidator, ValidationException, SchemaValidationException, expand
+
+def none_check(validator, names):
+    return "val is None", validator.none_type_exception
+
+def types_check(validator, names):
+    if len(validator.types) == 1:
+        return "type(val) is not {types}".format(types=names(validator.types[0])), validator.none_type_exception
+    return "type(val) not in {types}".format(types=names(validator.types)), validator.none_type_exception
+
+def value_check(operand, operator, inclusive_operator):
+    def check(validator, names):
+        op = validator.inclusive and operator or inclusive_operator
+        condition = "{operand} {op} {limit}".format(operand=operand, op=op, limit=names(validator.limit))
+        return condition, validator.exception
+    return check
+
+inline_checks = {
+    NoneTypeValidator: none_check,
+    TypesValidator: types_check,
+    MaxValidator: value_check("val", ">", ">="),
+    MinValidator: value_check("val", "<", "<="),
+    MaxLengthValidator: value_check("len(val)", ">", ">="),
+    MinLengthValidator: value_check("len(val)", "<", "<="),
+}
+
+def inlinable(field_type):
+    inline_validators = getattr(field_type, "inline_validators", None)
+    validators = inline_validators and inline_validators()
+    if validators is None:
+        return None
+    validators = expand(validators)
+    for validator in validators:
+        if validator.__class__ not in inline_checks:
+            return None
+    return validators
+
+class Namespace:
+    def __init__(self, **initial):
+        self.values = dict(initial)
+
+    def __call__(self, value, prefix="_c"):
+        name = "{prefix}{idx}".format(prefix=prefix, idx=len(self.values))
+        self.values[name] = value
+        return name
+
+def assign(key, value):
+    if key.isidentifier():
+        return "obj.{key} = {value}".format(key=key, value=value)
+    return "setattr(obj, {key!r}, {value})".format(key=key, value=value)
+
+def read(key):
+    if key.isidentifier():
+        return "obj.{key}".format(key=key)
+    return "getattr(obj, {key!r})".format(key=key)
+
+def default(schema, key, owner, names):
+    if key in schema._defaults:
+        return names(schema._defaults[key], "_d")
+    return "getattr({owner}, {key!r}, None)".format(owner=owner, key=key)
+
+def checkable(field_type, store):
+    if store is None:
+        return hasattr(field_type, "check")
+    returns_input = getattr(field_type, "returns_input", None)
+    return returns_input is not None and returns_input()
+
+def call_lines(key, type, names, call, store, record):
+    lines = ["    try:"]
+    if store is None:
+        lines.append("        " + call(names(type, "_t")))
+    else:
+        lines.append("        " + store(key, call(names(type, "_t"))))
+    lines.append("    except ValidationException as e:")
+    lines += ["        " + line for line in record(key, "e")]
+    return lines
+
+def field_lines(key, type, names, fallback, store, record):
+    validators = inlinable(type)
+    if validators is None and checkable(type, store):
+        lines = [
+            "    error = {type}.check(val, ctx)".format(type=names(type, "_t")),
+            "    if error is not None:",
+        ]
+        lines += ["        " + line for line in record(key, "error")]
+        if store is not None:
+            lines += [
+                "    else:",
+                "        " + store(key, "val"),
+            ]
+        return lines
+    if validators is None:
+        return call_lines(key, type, names, fallback, store, record)
+
+    lines = []
+    keyword = "if"
+    for validator in validators:
+        condition, exception = inline_checks[validator.__class__](validator, names)
+        lines.append("    {keyword} {condition}:".format(keyword=keyword, condition=condition))
+        lines += ["        " + line for line in record(key, names(exception, "_x"))]
+        keyword = "elif"
+    if store is not None:
+        if keyword == "if":
+            lines.append("    " + store(key, "val"))
+        else:
+            lines += [
+                "    else:",
+                "        " + store(key, "val"),
+            ]
+    return lines
+
+def build(name, schema, names, lines):
+    source = "\n".join(lines)
+    exec(compile(source, "<{name} {schema}>".format(name=name, schema=schema.__name__), "exec"), names.values)
+    function = names.values[name]
+    function.__source__ = source
+    return function
+
+unvalidated = object()
+
+def fill_slots(self):
+    for key, val in type(self)._defaults.items():
+        setattr(self, key, val)
+
+def allocate(schema):
+    if schema.__init__ is fill_slots:
+        return "schema.__new__(schema)"
+    return "schema()"
+
+def compile_from_json(schema, lazy=False):
+    names = Namespace(schema=schema, ValidationException=ValidationException, SchemaValidationException=SchemaValidationException, unvalidated=unvalidated)
+    lines = [
+        "def from_json(_val, ctx=None):",
+        "    obj = {allocate}".format(allocate=allocate(schema)),
+        "    errors = {}",
+    ]
+    record = lambda key, exception: [
+        "errors[{key!r}] = {exception}.error()".format(key=key, exception=exception),
+        "if ctx is not None and ctx.spend({exception}):".format(exception=exception),
+        "    raise SchemaValidationException(errors)",
+    ]
+    snapshot = []
+    for (key, type) in schema.__annotations__.items():
+        lines += [
+            "    if {key!r} in _val:".format(key=key),
+            "        val = _val[{key!r}]".format(key=key),
+            "    else:",
+            "        val = {default}".format(default=default(schema, key, "obj", names)),
+        ]
+        if lazy and getattr(type, "lazy", None) is not None:
+            lines += call_lines(key, type, names,
+                call=lambda type: "{type}.lazy(val, ctx)".format(type=type),
+                store=assign,
+                record=record)
+            snapshot.append("unvalidated")
+        else:
+            lines += field_lines(key, type, names,
+                fallback=lambda type: "{type}(val, ctx)".format(type=type),
+                store=assign,
+                record=record)
+            snapshot.append(read(key))
+    lines += [
+        "    if errors:",
+        "        raise SchemaValidationException(errors)",
+        "    obj._validated = ({values})".format(values="".join(value + ", " for value in snapshot)),
+        "    return obj",
+    ]
+    return build("from_json", schema, names, lines)
+
+def compile_check(schema):
+    names = Namespace(schema=schema, ValidationException=ValidationException, SchemaValidationException=SchemaValidationException)
+    lines = [
+        "def check(_val, ctx=None):",
+        "    errors = None",
+    ]
+    for (key, type) in schema.__annotations__.items():
+        lines += [
+            "    if {key!r} in _val:".format(key=key),
+            "        val = _val[{key!r}]".format(key=key),
+            "    else:",
+            "        val = {default}".format(default=default(schema, key, "schema", names)),
+        ]
+        lines += field_lines(key, type, names,
+            fallback=lambda type: "{type}.validate_only(val, ctx)".format(type=type),
+            store=None,
+            record=lambda key, exception: [
+                "if errors is None:",
+                "    errors = {}",
+                "errors[{key!r}] = {exception}.error()".format(key=key, exception=exception),
+                "if ctx is not None and ctx.spend({exception}):".format(exception=exception),
+                "    return SchemaValidationException(errors)",
+            ])
+    lines += [
+        "    if errors:",
+        "        return SchemaValidationException(errors)",
+    ]
+    return build("check", schema, names, lines)
+
+max_arguments = 255
+
+def compile_builder(schema):
+    names = Namespace(schema=schema)
+    keys = list(schema.__annotations__)
+    if len(keys) > max_arguments:
+        values = ["_v[{idx}]".format(idx=idx) for idx in range(len(keys))]
+        arguments = "*_v"
+        snapshot = "_v"
+    else:
+        values = ["_{idx}".format(idx=idx) for idx in range(len(keys))]
+        arguments = ", ".join(values)
+        snapshot = "({values})".format(values="".join(value + ", " for value in values))
+    lines = [
+        "def build({arguments}):".format(arguments=arguments),
+        "    obj = {allocate}".format(allocate=allocate(schema)),
+    ]
+    for (key, value) in zip(keys, values):
+        lines.append("    " + assign(key, value))
+    lines += [
+        "    obj._validated = {snapshot}".format(snapshot=snapshot),
+        "    return obj",
+    ]
+    return build("build", schema, names, lines)
+
+def compile_snapshot(schema):
+    names = Namespace()
+    values = "".join("getattr(obj, {key!r}, None), ".format(key=key) for key in schema.__annotations__)
+    lines = [
+        "def snapshot(obj):",
+        "    return ({values})".format(values=values),
+    ]
+    return build("snapshot", schema, names, lines)
+
+def compile_validate(schema):
+    names = Namespace(ValidationException=ValidationException, SchemaValidationException=SchemaValidationException, mutable=(list, dict), lazy=(LazyList, LazyDict))
+    keys = list(schema.__annotations__)
+    values = "".join("_{idx}, ".format(idx=idx) for idx in range(len(keys)))
+    lines = [
+        "def validate(obj, full=False):",
+        "    ctx = None",
+        "    errors = None",
+        "    validated = None if full else getattr(obj, '_validated', None)",
+        "    if validated is None:",
+        "        validated = {blank}".format(blank=names((unvalidated,) * len(keys), "_b")),
+    ]
+    if keys:
+        lines += [
+            "    try:",
+            "        {values}= {fields}".format(values=values, fields="".join(read(key) + ", " for key in keys)),
+            "    except AttributeError:",
+            "        {values}= {fields}".format(values=values, fields="".join("getattr(obj, {key!r}, None), ".format(key=key) for key in keys)),
+        ]
+    record = lambda key, exception: [
+        "if errors is None:",
+        "    errors = {}",
+        "errors[{key!r}] = {exception}.error()".format(key=key, exception=exception),
+    ]
+    indent = lambda depth, block: [" " * depth + line for line in block]
+    for (idx, (key, type)) in enumerate(schema.__annotations__.items()):
+        checks = [line[4:] for line in field_lines(key, type, names,
+            fallback=lambda type: "{type}.validate_only(val, ctx)".format(type=type),
+            store=None,
+            record=record)]
+        if getattr(type, "lazy", None) is not None and getattr(type, "schema", None) is None:
+            checks = [
+                "if val.__class__ in lazy:",
+                "    error = val.check()",
+                "    if error is not None:",
+            ] + indent(8, record(key, "error")) + ["else:"] + indent(4, checks)
+        nested = [
+            "try:",
+            "    val.validate(full)",
+            "except ValidationException as e:",
+        ] + indent(4, record(key, "e"))
+        if plain(type):
+            block = ["if val is not validated[{idx}] or val.__class__ in mutable:".format(idx=idx)] + indent(4, checks)
+        else:
+            block = [
+                "if val is validated[{idx}] and val.__class__ not in mutable:".format(idx=idx),
+                "    if getattr(val, 'is_schema', False):",
+            ] + indent(8, nested) + ["elif getattr(val, 'is_schema', False):"] + indent(4, nested) + ["else:"] + indent(4, checks)
+        lines.append("    val = _{idx}".format(idx=idx))
+        lines += indent(4, block)
+    lines += [
+        "    if errors:",
+        "        raise SchemaValidationException(errors)",
+        "    obj._validated = ({values})".format(values=values),
+    ]
+    return build("validate", schema, names, lines)
+
+def plain(field_type):
+    if getattr(field_type, "schema", None) is not None:
+        return False
+    for nested in (getattr(field_type, "item_type", None), getattr(field_type, "value_type", None)):
+        if nested is not None and not plain(nested):
+            return False
+    return all(plain(branch) for branch in getattr(field_type, "branches", ()))
+
+def compile_dict(name, schema, names, value):
+    items = list(schema.__annotations__.items())
+    lines = [
+        "def {name}(obj):".format(name=name),
+        "    try:",
+        "        return {{{items}}}".format(items=", ".join("{key!r}: {value}".format(key=key, value=value(type, read(key))) for (key, type) in items)),
+        "    except AttributeError:",
+        "        return {{{items}}}".format(items=", ".join("{key!r}: {value}".format(key=key, value=value(type, "getattr(obj, {key!r}, None)".format(key=key))) for (key, type) in items)),
+    ]
+    return build(name, schema, names, lines)
+
+def compile_to_json(schema):
+    names = Namespace(encode=encode)
+    return compile_dict("to_json", schema, names, lambda type, value: value if plain(type) else "encode({value})".format(value=value))
+
+def compile_fields(schema):
+    return compile_dict("fields", schema, Namespace(), lambda type, value: value)
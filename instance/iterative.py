@@ -0,0 +1,293 @@
+"""
+MIT License
+
+Copyright (c) 2017 Brandon Hoffman
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import instance.shared
+import instance.types
+from instance.validators import ValidationException, SchemaValidationException
+
+nodes = {}
+plans = {}
+
+def schema_fields(schema_type, val, ctx, build, key=None):
+    schema = schema_type.schema
+    defaults = schema._defaults
+    obj = schema() if build else None
+    owner = obj if build else schema
+    errors = None
+    for (name, field_type, walk, checks, returns_input) in plan(schema_type):
+        if name in val:
+            value = val[name]
+        elif name in defaults:
+            value = defaults[name]
+        else:
+            value = getattr(owner, name, None)
+        if walk is not None:
+            result = walk(field_type, value, ctx, build)
+            if type(result) is not tuple:
+                result = yield result
+            if returns_input:
+                error = result[1]
+            else:
+                value, error = result
+        elif checks is not None:
+            error = None
+            for check in checks:
+                error = check(value)
+                if error is not None:
+                    break
+        elif build and not returns_input:
+            try:
+                value, error = field_type(value, ctx), None
+            except ValidationException as e:
+                error = e
+        else:
+            error = field_type.check(value, ctx)
+        if error is not None:
+            if errors is None:
+                errors = {}
+            errors[name] = error.error()
+            if ctx is not None and ctx.spend(error):
+                break
+        elif build:
+            setattr(obj, name, value)
+    if errors:
+        result = None, SchemaValidationException(errors)
+    else:
+        if build:
+            obj._validated = schema_type.snapshot(obj)
+        result = obj, None
+    if key is not None:
+        ctx.memo[key] = result
+        return instance.shared.fresh(result)
+    return result
+
+def schema_node(schema_type, val, ctx, build):
+    key = None
+    if ctx is not None and ctx.memo is not None:
+        key = (id(val), schema_type)
+        result = instance.shared.lookup(ctx, key, build)
+        if result is not None:
+            return result
+    for check in schema_type.checks:
+        error = check(val)
+        if error is not None:
+            return None, error
+    if key is not None:
+        ctx.memo[key] = instance.shared.pending
+    return schema_fields(schema_type, val, ctx, build, key)
+
+def list_items(item_type, val, ctx):
+    walk = node(item_type)
+    errors = None
+    for (index, value) in enumerate(val):
+        result = walk(item_type, value, ctx, False)
+        if type(result) is not tuple:
+            result = yield result
+        error = result[1]
+        if error is not None:
+            details = error.error()
+            details["index"] = index
+            if errors is None:
+                errors = []
+            errors.append(details)
+            if ctx is not None and ctx.spend(error):
+                break
+    if errors:
+        return val, SchemaValidationException(errors)
+    return val, None
+
+def list_node(list_type, val, ctx, build):
+    for check in list_type.checks:
+        error = check(val)
+        if error is not None:
+            return val, error
+    if not val:
+        return val, None
+    return list_items(list_type.item_type, val, ctx)
+
+def dict_items(key_type, value_type, val, ctx):
+    walk = node(value_type)
+    for (key, value) in val.items():
+        error = key_type.check(key, ctx)
+        if error is None:
+            result = walk(value_type, value, ctx, False)
+            if type(result) is not tuple:
+                result = yield result
+            error = result[1]
+        if error is not None:
+            return val, error
+    return val, None
+
+def dict_node(dict_type, val, ctx, build):
+    for check in dict_type.checks:
+        error = check(val)
+        if error is not None:
+            return val, error
+    if not val:
+        return val, None
+    return dict_items(dict_type.key_type, dict_type.value_type, val, ctx)
+
+def optional_node(optional_type, val, ctx, build):
+    if val is None:
+        return val, None
+    item_type = optional_type.item_type
+    return node(item_type)(item_type, val, ctx, False)
+
+def union_branches(union_type, val, ctx, candidates, failures):
+    for actual_type in candidates:
+        walk = node(actual_type)
+        if walk is None:
+            error = actual_type.check(val, ctx and ctx.branch())
+        else:
+            result = walk(actual_type, val, ctx and ctx.branch(), False)
+            if type(result) is not tuple:
+                result = yield result
+            error = result[1]
+        if error is None:
+            return val, None
+        failures[actual_type] = error
+
+    errors = []
+    for actual_type in union_type.branches:
+        error = failures.get(actual_type)
+        if error is None:
+            walk = node(actual_type)
+            if walk is None:
+                error = actual_type.check(val, ctx and ctx.branch())
+            else:
+                result = walk(actual_type, val, ctx and ctx.branch(), False)
+                if type(result) is not tuple:
+                    result = yield result
+                error = result[1]
+        errors.append(error.error())
+    if ctx is not None:
+        ctx.error_count += 1
+    return val, SchemaValidationException(errors)
+
+def union_node(union_type, val, ctx, build):
+    for check in union_type.checks:
+        error = check(val)
+        if error is not None:
+            return val, error
+
+    if union_type.discriminator is not None:
+        if not isinstance(val, dict):
+            return val, union_type.type_exception
+        actual_type = union_type.tagged(val)
+        if actual_type is None:
+            return val, union_type.tag_exception
+        walk = node(actual_type) or leaf
+        return walk(actual_type, val, ctx, False)
+
+    candidates = union_type.dispatch.get(type(val), union_type.untyped)
+    failures = {}
+    for (index, actual_type) in enumerate(candidates):
+        if node(actual_type) is not None:
+            return union_branches(union_type, val, ctx, candidates[index:], failures)
+        error = actual_type.check(val, ctx and ctx.branch())
+        if error is None:
+            return val, None
+        failures[actual_type] = error
+    return union_branches(union_type, val, ctx, (), failures)
+
+def leaf(field_type, val, ctx, build):
+    if build and not field_type.returns_input():
+        try:
+            return field_type(val, ctx), None
+        except ValidationException as e:
+            return None, e
+    return val, field_type.check(val, ctx)
+
+def classify(field_type):
+    cls = field_type.__class__
+    if isinstance(field_type, instance.types.SchemaType):
+        if cls.__call__ is instance.types.SchemaType.__call__ and cls.check is instance.types.SchemaType.check:
+            nodes[field_type] = schema_node
+            for (key, nested_type, walk, checks, returns_input) in plan(field_type):
+                if walk is not None:
+                    return schema_node
+    elif isinstance(field_type, instance.types.List):
+        if cls.check is instance.types.List.check and node(field_type.item_type) is not None:
+            return list_node
+    elif isinstance(field_type, instance.types.Dictionary):
+        if cls.check is instance.types.Dictionary.check and node(field_type.value_type) is not None:
+            return dict_node
+    elif isinstance(field_type, instance.types.Optional):
+        if cls.check is instance.types.Optional.check and node(field_type.item_type) is not None:
+            return optional_node
+    elif isinstance(field_type, instance.types.Union):
+        if cls.check is instance.types.Union.check:
+            for branch in field_type.branches:
+                if node(branch) is not None:
+                    return union_node
+    return None
+
+def node(field_type):
+    try:
+        return nodes[field_type]
+    except KeyError:
+        walk = nodes[field_type] = classify(field_type)
+        return walk
+
+def inline_checks(field_type):
+    if field_type.inline_validators() is None:
+        return None
+    return field_type.checks
+
+def plan(schema_type):
+    fields = plans.get(schema_type)
+    if fields is None:
+        fields = plans[schema_type] = [
+            (key, field_type, node(field_type), inline_checks(field_type), field_type.returns_input())
+            for (key, field_type) in schema_type.schema.__annotations__.items()
+        ]
+    return fields
+
+def run(field_type, val, ctx=None, build=False):
+    walk = node(field_type) or leaf
+    result = walk(field_type, val, ctx, build)
+    if type(result) is tuple:
+        return result
+
+    stack = [result]
+    result = None
+    while stack:
+        try:
+            child = stack[-1].send(result)
+        except StopIteration as stop:
+            stack.pop()
+            result = stop.value
+        else:
+            stack.append(child)
+            result = None
+    return result
+
+def from_json(schema_type, val, ctx=None):
+    obj, error = run(schema_type, val, ctx, True)
+    if error is not None:
+        raise error
+    return obj
+
+def check(schema_type, val, ctx=None):
+    return run(schema_type, val, ctx)[1]
@@ -0,0 +1,127 @@
+"""
+MIT License
+
+Copyright (c) 2017 Brandon Hoffman
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from collections.abc import Sequence, Mapping
+from instance.validators import ValidationException, SchemaValidationException
+
+class Lazy:
+    def validate_all(self):
+        error = self.check()
+        if error is not None:
+            raise error
+
+class LazyList(Lazy, Sequence):
+    def __init__(self, item_type, raw):
+        self.item_type = item_type
+        self.raw = raw
+        self.items = [None] * len(raw)
+
+    def __len__(self):
+        return len(self.raw)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[idx] for idx in range(*index.indices(len(self.raw)))]
+        item = self.items[index]
+        if item is None:
+            item = self.items[index] = self.item_type(self.raw[index], lazy=True)
+        return item
+
+    def check(self):
+        errors = None
+        for (index, item) in enumerate(self.items):
+            if item is None:
+                error = self.item_type.check(self.raw[index])
+            else:
+                try:
+                    item.validate()
+                    error = None
+                except ValidationException as e:
+                    error = e
+            if error is not None:
+                details = error.error()
+                details["index"] = index
+                if errors is None:
+                    errors = []
+                errors.append(details)
+        if errors:
+            return SchemaValidationException(errors)
+
+    def to_json(self):
+        return [self.raw[index] if item is None else item.to_json() for (index, item) in enumerate(self.items)]
+
+    def shallow(self):
+        return [self.raw[index] if item is None else item for (index, item) in enumerate(self.items)]
+
+    def __repr__(self):
+        return "LazyList({raw!r})".format(raw=self.raw)
+
+class LazyDict(Lazy, Mapping):
+    def __init__(self, key_type, value_type, raw):
+        self.key_type = key_type
+        self.value_type = value_type
+        self.raw = raw
+        self.values = {}
+
+    def __len__(self):
+        return len(self.raw)
+
+    def __iter__(self):
+        return iter(self.raw)
+
+    def __contains__(self, key):
+        return key in self.raw
+
+    def __getitem__(self, key):
+        value = self.values.get(key)
+        if value is None:
+            self.key_type.validate(key)
+            value = self.values[key] = self.value_type(self.raw[key], lazy=True)
+        return value
+
+    def check(self):
+        check_key = self.key_type.check
+        for (key, raw) in self.raw.items():
+            error = check_key(key)
+            if error is not None:
+                return error
+            value = self.values.get(key)
+            if value is None:
+                error = self.value_type.check(raw)
+            else:
+                try:
+                    value.validate()
+                except ValidationException as e:
+                    error = e
+            if error is not None:
+                return error
+
+    def to_json(self):
+        return {key: self.values[key].to_json() if key in self.values else raw for (key, raw) in self.raw.items()}
+
+    def shallow(self):
+        return {key: self.values.get(key, raw) for (key, raw) in self.raw.items()}
+
+    def __repr__(self):
+        return "LazyDict({raw!r})".format(raw=self.raw)
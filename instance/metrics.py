@@ -0,0 +1,193 @@
+"""
+MIT License
+
+Copyright (c) 2017 Brandon Hoffman
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from time import perf_counter
+from instance.validators import ValidationException, SchemaValidationException, checker
+
+enabled = False
+schemas = {}
+
+def enable():
+    global enabled
+    enabled = True
+
+def disable():
+    global enabled
+    enabled = False
+
+def reset():
+    schemas.clear()
+
+def failure_code(error):
+    if isinstance(error, SchemaValidationException):
+        return "nested"
+    return error.code
+
+def validator_name(validator):
+    return getattr(validator, "__qualname__", validator.__class__.__name__)
+
+class Stats:
+    def __init__(self):
+        self.calls = 0
+        self.time = 0.0
+        self.max = 0.0
+        self.failures = {}
+
+    def record(self, elapsed, error):
+        self.calls += 1
+        self.time += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+        if error is not None:
+            code = failure_code(error)
+            self.failures[code] = self.failures.get(code, 0) + 1
+
+    def report(self):
+        return {
+            "calls": self.calls,
+            "time": self.time,
+            "max": self.max,
+            "failures": dict(self.failures),
+        }
+
+class ValidatorStats(Stats):
+    def __init__(self, validator):
+        Stats.__init__(self)
+        self.name = validator_name(validator)
+        self.check = checker(validator)
+
+    def report(self):
+        report = Stats.report(self)
+        report["validator"] = self.name
+        return report
+
+class FieldStats(Stats):
+    def __init__(self, field_type):
+        Stats.__init__(self)
+        self.type = field_type
+        inline_validators = getattr(field_type, "inline_validators", None)
+        validators = inline_validators and inline_validators()
+        self.validators = validators and [ValidatorStats(validator) for validator in validators]
+        self.returns_input = field_type.returns_input()
+
+    def check(self, val):
+        for validator in self.validators:
+            start = perf_counter()
+            error = validator.check(val)
+            validator.record(perf_counter() - start, error)
+            if error is not None:
+                return error
+
+    def convert(self, val, ctx, build):
+        if self.validators is not None:
+            return val, self.check(val)
+        if not build or self.returns_input:
+            return val, self.type.check(val, ctx)
+        try:
+            return self.type(val, ctx), None
+        except ValidationException as e:
+            return None, e
+
+    def report(self):
+        report = Stats.report(self)
+        if self.validators is not None:
+            report["validators"] = [validator.report() for validator in self.validators]
+        return report
+
+def schema_name(schema):
+    name = "{module}.{qualname}".format(module=schema.__module__, qualname=schema.__qualname__)
+    args = getattr(schema, "__args__", None)
+    if args:
+        name += "[{args}]".format(args=", ".join(repr(arg) for arg in args))
+    return name
+
+class SchemaStats(Stats):
+    def __init__(self, schema_type):
+        Stats.__init__(self)
+        self.name = schema_name(schema_type.schema)
+        self.fields = {key: FieldStats(type) for (key, type) in schema_type.schema.__annotations__.items()}
+
+def schema_stats(schema_type):
+    stats = schemas.get(schema_type)
+    if stats is None:
+        stats = schemas[schema_type] = SchemaStats(schema_type)
+    return stats
+
+def run(schema_type, stats, _val, ctx, build):
+    for check in schema_type.checks:
+        error = check(_val)
+        if error is not None:
+            return None, error
+
+    schema = schema_type.schema
+    obj = schema() if build else None
+    errors = None
+    for (key, field) in stats.fields.items():
+        if key in _val:
+            val = _val[key]
+        elif key in schema._defaults:
+            val = schema._defaults[key]
+        else:
+            val = getattr(schema, key, None)
+        start = perf_counter()
+        val, error = field.convert(val, ctx, build)
+        field.record(perf_counter() - start, error)
+        if error is None:
+            if build:
+                setattr(obj, key, val)
+            continue
+        if errors is None:
+            errors = {}
+        errors[key] = error.error()
+        if ctx is not None and ctx.spend(error):
+            break
+    if errors:
+        return None, SchemaValidationException(errors)
+    if build:
+        obj._validated = schema_type.snapshot(obj)
+    return obj, None
+
+def measure(schema_type, _val, ctx, build):
+    stats = schema_stats(schema_type)
+    start = perf_counter()
+    obj, error = run(schema_type, stats, _val, ctx, build)
+    stats.record(perf_counter() - start, error)
+    return obj, error
+
+def from_json(schema_type, _val, ctx=None):
+    obj, error = measure(schema_type, _val, ctx, True)
+    if error is not None:
+        raise error
+    return obj
+
+def check(schema_type, _val, ctx=None):
+    return measure(schema_type, _val, ctx, False)[1]
+
+def report():
+    report = {}
+    for stats in schemas.values():
+        report[stats.name] = stats.report()
+        for (key, field) in stats.fields.items():
+            report["{name}.{key}".format(name=stats.name, key=key)] = field.report()
+    return report
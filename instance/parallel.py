@@ -0,0 +1,44 @@
+"""
+MIT License
+
+Copyright (c) 2017 Brandon Hoffman
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from itertools import repeat
+import instance.batch
+
+def validate_chunk(schema, records):
+    return instance.batch.from_json_many(schema.from_json, records)
+
+def from_json_parallel(schema_type, records, workers=None, chunksize=1000):
+    from concurrent.futures import ProcessPoolExecutor
+    records = list(records)
+    offsets = range(0, len(records), chunksize)
+    chunks = [records[offset:offset + chunksize] for offset in offsets]
+    objects = []
+    errors = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(validate_chunk, repeat(schema_type.schema), chunks)
+        for (offset, (chunk_objects, chunk_errors)) in zip(offsets, results):
+            objects.extend(chunk_objects)
+            for (idx, error) in chunk_errors.items():
+                errors[offset + idx] = error
+    return objects, errors
@@ -0,0 +1,79 @@
+"""
+MIT License
+
+Copyright (c) 2017 Brandon Hoffman
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import copy as copying
+from instance.validators import ValidationException, SchemaValidationException
+
+def convert(type, val):
+    if type.returns_input():
+        return val, type.check(val)
+    try:
+        return type(val), None
+    except ValidationException as e:
+        return None, e
+
+def plan(schema_type, obj, delta):
+    annotations = schema_type.schema.__annotations__
+    changes = {}
+    errors = {}
+    for (key, val) in delta.items():
+        type = annotations.get(key)
+        if type is None:
+            continue
+        current = getattr(obj, key, None)
+        nested = getattr(type, "schema", None)
+        if nested is not None and isinstance(current, nested) and isinstance(val, dict):
+            try:
+                changes[key] = (True, plan(type, current, val))
+            except ValidationException as e:
+                errors[key] = e.error()
+            continue
+        new_val, error = convert(type, val)
+        if error is not None:
+            errors[key] = error.error()
+        else:
+            changes[key] = (False, new_val)
+    if errors:
+        raise SchemaValidationException(errors)
+    return changes
+
+def apply(schema_type, obj, changes, copy):
+    if copy:
+        obj = copying.copy(obj)
+    for (key, (nested, val)) in changes.items():
+        if nested:
+            val = apply(schema_type.schema.__annotations__[key], getattr(obj, key), val, copy)
+        setattr(obj, key, val)
+
+    validated = getattr(obj, "_validated", None)
+    if validated is not None:
+        validated = list(validated)
+        positions = schema_type.positions
+        for key in changes:
+            validated[positions[key]] = getattr(obj, key)
+        obj._validated = tuple(validated)
+    return obj
+
+def apply_patch(schema_type, obj, delta, copy=False):
+    return apply(schema_type, obj, plan(schema_type, obj, delta), copy)
@@ -0,0 +1,154 @@
+"""
+MIT License
+
+Copyright (c) 2017 Brandon Hoffman
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import functools
+import instance.types
+from instance.validators import ValidationException, SchemaValidationException
+
+@functools.lru_cache(maxsize=256)
+def parse(fields):
+    tree = {}
+    for field in fields:
+        parts = []
+        for part in field.split("."):
+            items = 0
+            while part.endswith("[]"):
+                part = part[:-2]
+                items += 1
+            parts.append(part)
+            parts += ["[]"] * items
+        node = tree
+        for part in parts[:-1]:
+            if part in node and node[part] is None:
+                break
+            node = node.setdefault(part, {})
+        else:
+            node[parts[-1]] = None
+    return tree
+
+def resolve(type, tree):
+    if tree is None:
+        return
+    if isinstance(type, instance.types.SchemaType):
+        annotations = type.schema.__annotations__
+        for (key, subtree) in tree.items():
+            if key not in annotations:
+                raise ValueError("{schema} has no field {key!r}".format(schema=type.schema.__name__, key=key))
+            resolve(annotations[key], subtree)
+    elif isinstance(type, instance.types.Optional):
+        resolve(type.item_type, tree)
+    elif isinstance(type, instance.types.List) and set(tree) == {"[]"}:
+        resolve(type.item_type, tree["[]"])
+    elif isinstance(type, instance.types.Dictionary) and set(tree) == {"[]"}:
+        resolve(type.value_type, tree["[]"])
+    else:
+        raise ValueError("{type} has no fields {keys}".format(type=type, keys=", ".join(sorted(map(repr, tree)))))
+
+@functools.lru_cache(maxsize=256)
+def plan(schema_type, fields):
+    tree = parse(fields)
+    resolve(schema_type, tree)
+    return tree
+
+def field_value(schema, key, val):
+    if key in val:
+        return val[key]
+    if key in schema._defaults:
+        return schema._defaults[key]
+    return getattr(schema, key, None)
+
+def project_schema(schema_type, val, tree, ctx, build):
+    for check in schema_type.checks:
+        error = check(val)
+        if error is not None:
+            return None, error
+
+    schema = schema_type.schema
+    annotations = schema.__annotations__
+    obj = schema() if build else None
+    errors = None
+    for (key, subtree) in tree.items():
+        value, error = project(annotations[key], field_value(schema, key, val), subtree, ctx, build)
+        if error is not None:
+            if errors is None:
+                errors = {}
+            errors[key] = error.error()
+            if ctx is not None and ctx.spend(error):
+                break
+        elif build:
+            setattr(obj, key, value)
+    if errors:
+        return None, SchemaValidationException(errors)
+    return obj, None
+
+def project_items(type, val, tree, ctx):
+    for check in type.checks:
+        error = check(val)
+        if error is not None:
+            return val, error
+
+    if isinstance(type, instance.types.Dictionary):
+        check_key = type.key_type.check
+        for (key, value) in val.items():
+            error = check_key(key, ctx) or project(type.value_type, value, tree, ctx, False)[1]
+            if error is not None:
+                return val, error
+        return val, None
+
+    errors = None
+    for (index, value) in enumerate(val):
+        error = project(type.item_type, value, tree, ctx, False)[1]
+        if error is not None:
+            details = error.error()
+            details["index"] = index
+            if errors is None:
+                errors = []
+            errors.append(details)
+            if ctx is not None and ctx.spend(error):
+                break
+    if errors:
+        return val, SchemaValidationException(errors)
+    return val, None
+
+def project(type, val, tree, ctx, build):
+    if tree is None:
+        if build and not type.returns_input():
+            try:
+                return type(val, ctx), None
+            except ValidationException as e:
+                return None, e
+        return val, type.check(val, ctx)
+    if isinstance(type, instance.types.SchemaType):
+        return project_schema(type, val, tree, ctx, build)
+    if isinstance(type, instance.types.Optional):
+        if val is None:
+            return val, None
+        return val, project(type.item_type, val, tree, ctx, False)[1]
+    return project_items(type, val, tree["[]"], ctx)
+
+def from_json_fields(schema_type, val, fields, ctx=None):
+    obj, error = project_schema(schema_type, val, plan(schema_type, frozenset(fields)), ctx, True)
+    if error is not None:
+        raise error
+    return obj
@@ -0,0 +1,53 @@
+"""
+MIT License
+
+Copyright (c) 2017 Brandon Hoffman
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import json
+from instance.lazy import Lazy
+
+def encode(val):
+    if getattr(val, "is_schema", False):
+        return val.to_json()
+    if isinstance(val, Lazy):
+        return val.to_json()
+    value_type = type(val)
+    if value_type is list or value_type is tuple:
+        return [encode(item) for item in val]
+    if value_type is dict:
+        return {key: encode(item) for (key, item) in val.items()}
+    return val
+
+def default(val):
+    if getattr(val, "is_schema", False):
+        return val.from_json.fields(val)
+    if isinstance(val, Lazy):
+        return val.shallow()
+    raise TypeError("{val!r} is not JSON serializable".format(val=val))
+
+encoder = json.JSONEncoder(default=default, check_circular=False)
+
+def to_json_string(obj):
+    return encoder.encode(obj)
+
+def dump(obj, fp):
+    fp.write(encoder.encode(obj))
@@ -0,0 +1,79 @@
+"""
+MIT License
+
+Copyright (c) 2017 Brandon Hoffman
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import instance.metrics
+from instance.validators import ValidationException, SchemaValidationException
+
+pending = object()
+cycle_exception = ValidationException(7, "cyclic reference")
+
+def convert(schema_type, _val, ctx, build):
+    if instance.metrics.enabled:
+        return instance.metrics.measure(schema_type, _val, ctx, build)
+    for check in schema_type.checks:
+        error = check(_val)
+        if error is not None:
+            return None, error
+    if not build:
+        if schema_type.compiled_check is not None:
+            return None, schema_type.compiled_check(_val, ctx)
+        return None, schema_type.interpret_check(_val, ctx)
+    try:
+        if schema_type.compiled is not None:
+            return schema_type.compiled(_val, ctx), None
+        return schema_type.interpret(_val, ctx), None
+    except ValidationException as e:
+        return None, e
+
+def fresh(result):
+    obj, error = result
+    if type(error) is SchemaValidationException:
+        return obj, SchemaValidationException(dict(error.errors))
+    return result
+
+def lookup(ctx, key, build):
+    result = ctx.memo.get(key)
+    if result is pending:
+        return None, cycle_exception
+    if result is None or build and result[0] is None and result[1] is None:
+        return None
+    return fresh(result)
+
+def recall(schema_type, _val, ctx, build):
+    key = (id(_val), schema_type)
+    result = lookup(ctx, key, build)
+    if result is None:
+        ctx.memo[key] = pending
+        result = ctx.memo[key] = convert(schema_type, _val, ctx, build)
+        result = fresh(result)
+    return result
+
+def from_json(schema_type, _val, ctx):
+    obj, error = recall(schema_type, _val, ctx, True)
+    if error is not None:
+        raise error
+    return obj
+
+def check(schema_type, _val, ctx):
+    return recall(schema_type, _val, ctx, False)[1]
@@ -0,0 +1,167 @@
+"""
+MIT License
+
+Copyright (c) 2017 Brandon Hoffman
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import codecs
+import json
+from instance.validators import ValidationException
+
+decoder = json.JSONDecoder()
+whitespace = " \t\n\r"
+delimiters = whitespace + ",]"
+
+class Reader:
+    def __init__(self, source, chunk_size):
+        if hasattr(source, "read"):
+            self.read = source.read
+        else:
+            self.read = source.recv
+        self.chunk_size = chunk_size
+        self.decoder = None
+        self.eof = False
+
+    def __call__(self, size=0):
+        chunk = self.read(max(size, self.chunk_size))
+        if not chunk:
+            self.eof = True
+            if self.decoder is not None:
+                return self.decoder.decode(b"", final=True)
+            return ""
+        if isinstance(chunk, str):
+            return chunk
+        if self.decoder is None:
+            self.decoder = codecs.getincrementaldecoder("utf-8")()
+        return self.decoder.decode(chunk)
+
+def skip_whitespace(buffer, pos):
+    while pos < len(buffer) and buffer[pos] in whitespace:
+        pos += 1
+    return pos
+
+def element_end(buffer, pos):
+    depth = 0
+    quoted = False
+    escaped = False
+    for index in range(pos, len(buffer)):
+        char = buffer[index]
+        if quoted:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                quoted = False
+        elif char == '"':
+            quoted = True
+        elif char in "[{":
+            depth += 1
+        elif char in "]}" and depth:
+            depth -= 1
+        elif char in ",]" and not depth:
+            return index
+    return None
+
+def iter_lines(read, buffer):
+    while True:
+        lines = buffer.split("\n")
+        buffer = lines.pop()
+        for line in lines:
+            if line.strip():
+                yield line
+        if read.eof:
+            break
+        buffer += read()
+    if buffer.strip():
+        yield buffer
+
+def iter_ndjson(read, buffer):
+    for line in iter_lines(read, buffer):
+        try:
+            yield json.loads(line)
+        except ValueError:
+            yield ValidationException(3, "invalid json")
+
+def iter_array(read, buffer):
+    pos = skip_whitespace(buffer, 0) + 1
+    expect_value = True
+    while True:
+        pos = skip_whitespace(buffer, pos)
+        if pos >= len(buffer):
+            if read.eof:
+                raise ValueError("unexpected end of JSON array")
+            buffer = buffer[pos:] + read()
+            pos = 0
+            continue
+        char = buffer[pos]
+        if char == "]":
+            return
+        if not expect_value:
+            if char != ",":
+                raise ValueError("expected ',' or ']' at position {pos}".format(pos=pos))
+            pos += 1
+            expect_value = True
+            continue
+        try:
+            value, end = decoder.raw_decode(buffer, pos)
+        except ValueError:
+            end = None
+        if end is not None and (end < len(buffer) and buffer[end] in delimiters or end >= len(buffer) and read.eof):
+            yield value
+            pos = end
+            expect_value = False
+            continue
+        end = element_end(buffer, pos)
+        if end is None:
+            if read.eof:
+                raise ValueError("invalid JSON array element at position {pos}".format(pos=pos))
+            buffer = buffer[pos:] + read(len(buffer) - pos)
+            pos = 0
+            continue
+        yield ValidationException(3, "invalid json")
+        pos = end
+        expect_value = False
+
+def iter_values(source, chunk_size=65536):
+    read = Reader(source, chunk_size)
+    buffer = ""
+    pos = 0
+    while not read.eof:
+        buffer += read()
+        pos = skip_whitespace(buffer, 0)
+        if pos < len(buffer):
+            break
+    if pos >= len(buffer):
+        return iter(())
+    if buffer[pos] == "[":
+        return iter_array(read, buffer[pos:])
+    return iter_ndjson(read, buffer[pos:])
+
+def iter_validate(schema_type, source, chunk_size=65536, **options):
+    for (index, value) in enumerate(iter_values(source, chunk_size)):
+        if isinstance(value, ValidationException):
+            yield index, value
+            continue
+        try:
+            yield index, schema_type(value, **options)
+        except ValidationException as e:
+            yield index, e
@@ -22,15 +22,36 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import copyreg
+import functools
+import importlib
+import inspect
+import operator
+import sys
 import typing
 from typing import GenericMeta
-from instance.validators import NoneTypeValidator, TypesValidator, ValidationException, SchemaValidationException
+from instance.validators import InstanceValidator, NoneTypeValidator, TypesValidator, ValidationException, SchemaValidationException, checker, optimize, memoize
+from instance.compiler import compile_from_json, compile_check, compile_builder, compile_snapshot, compile_to_json, compile_fields, compile_validate, fill_slots
+import instance.batch
+import instance.binary
+import instance.decoder
+import instance.iterative
+import instance.lazy
+import instance.metrics
+import instance.parallel
+import instance.patch
+import instance.projection
+import instance.serialize
+import instance.shared
+import instance.stream
  
 generics_map = {}
+parameterized_classes = {}
+interned_types = {}
  
 def map_type(generic):
-    def decorator(func, validators=[]):
-        inited = func(validators=validators)
+    def decorator(func, validators=[], **options):
+        inited = func(validators=validators, **options)
         generics_map[generic] = inited
         generics_map[func] = inited
         return func
@@ -38,48 +59,105 @@ def map_type(generic):
 
 def merge_validators(original_class, new_type):
     return hasattr(original_class, "validators") and original_class.validators or new_type.validators
+
+def parameterized_type(origin, args, validators):
+    new_class = origin[args]
+    key = (new_class, tuple(id(validator) for validator in validators))
+    new = interned_types.get(key)
+    if new is None:
+        new = interned_types[key] = new_class(validators=validators)
+    return new
     
 def mapped_type(original):
-    if getattr(original, "is_schema", False):
+    if isinstance(original, Type):
+        return original
+    elif getattr(original, "is_schema", False):
         return original.from_json
     elif hasattr(original, "__args__") and original.__args__:
         original_class = original.__origin__
         new = generics_map.get(original_class, original_class)
         new_validators_list = merge_validators(original_class, new)
-        new = new.__class__[original.__args__](validators=new_validators_list)
-        return new
+        return parameterized_type(new.__class__, original.__args__, new_validators_list)
     else:
         new = generics_map.get(original, original)
         return new
     
+def caller_module(depth=2):
+    try:
+        return sys._getframe(depth).f_globals.get("__name__", "__main__")
+    except (AttributeError, ValueError):
+        return None
+
+def find_type(module, qualname):
+    obj = importlib.import_module(module)
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+    return obj
+
+def validated_type_class(new_type):
+    return generics_map[new_type].__class__
+
+def reduce_type_class(cls):
+    if cls.__origin__ is not None:
+        return operator.getitem, (cls.__origin__, cls.__args__)
+    if "__newtype__" in cls.__dict__:
+        return validated_type_class, (cls.__newtype__,)
+    return find_type, (cls.__module__, cls.__qualname__)
+
 def create_type(types, desc):
     standard_validators = [NoneTypeValidator(), TypesValidator(types)]
     class NewType(Type):
         base_validators = list(standard_validators)
 
-        def __init__(self, validators=[]):
-            self.validators = list(validators)
-            self.all_validators = []
-            self.all_validators += self.base_validators
-            self.all_validators += self.validators
-
         def __repr__(self):
             return desc
     NewType.__valid_types__ = types
     NewType.__name__ = desc
+    NewType.__qualname__ = desc
+    NewType.__module__ = caller_module() or NewType.__module__
     return NewType
  
-def create_validated_type(name, type, validators=[]):
+def create_validated_type(name, type, validators=[], cache=None):
     new_type = typing.NewType(name, type)
+    new_type.__qualname__ = name
+    new_type.__module__ = caller_module() or new_type.__module__
     old_type = mapped_type(type)
     new_validators = list(old_type.validators)
     new_validators.extend(validators)
     class NewValidatedType(old_type.__class__):
         def __repr__(self):
             return "<{name}>".format(name=name)
-    map_type(new_type)(NewValidatedType, validators=new_validators)
+    NewValidatedType.__newtype__ = new_type
+    map_type(new_type)(NewValidatedType, validators=new_validators, cache=cache)
     return new_type
 
+def check_validate(self, _val, ctx=None):
+    try:
+        self.validate(_val, ctx)
+    except ValidationException as e:
+        return e
+
+def takes_context(validate):
+    try:
+        inspect.signature(validate).bind(None, None, None)
+    except TypeError:
+        return False
+    return True
+
+def drop_context(validate):
+    @functools.wraps(validate)
+    def validate_without_context(self, _val, ctx=None):
+        return validate(self, _val)
+    return validate_without_context
+
+def validate_check(check):
+    def validate(self, _val, ctx=None):
+        error = check(self, _val, ctx)
+        if error is not None:
+            raise error
+        return _val
+    return validate
+
 T = typing.TypeVar('T')
 K = typing.TypeVar('K')
 V = typing.TypeVar('V')
@@ -104,10 +182,28 @@ class TypeMeta(typing.GenericMeta):
 
         if new_args:
             kwargs["args"] = new_args
+
+        schema = dct.get("is_schema", False) or bool([parent for parent in parents if getattr(parent, "is_schema", False)])
+        if "validate" in dct and not schema and not takes_context(dct["validate"]):
+            dct["validate"] = drop_context(dct["validate"])
+        if "validate" in dct and "check" not in dct:
+            dct["check"] = check_validate
+        elif "check" in dct and "validate" not in dct:
+            dct["validate"] = validate_check(dct["check"])
             
         obj = super(TypeMeta, cls).__new__(cls, name, parents, dct, **kwargs)
         return obj
 
+    def __getitem__(cls, params):
+        if not isinstance(params, tuple):
+            params = (params,)
+        params = tuple(mapped_type(param) for param in params)
+        key = (cls, params)
+        new_class = parameterized_classes.get(key)
+        if new_class is None:
+            new_class = parameterized_classes[key] = super(TypeMeta, cls).__getitem__(params)
+        return new_class
+
     def __repr__(self):
         if(hasattr(self, "__args__") and self.__args__):
             args = [repr(arg) for arg in self.__args__]
@@ -123,9 +219,20 @@ class UnionMeta(TypeMeta):
             return Optional[args[0]]
         else:
             return super(UnionMeta, cls).__new__(cls, name, parents, dct, **kwargs)
+
+    def __getitem__(cls, params):
+        if isinstance(params, tuple):
+            rest = tuple(param for param in params if param is not None.__class__)
+            if rest and len(rest) < len(params):
+                params = (len(rest) == 1 and rest[0] or cls[rest], None.__class__)
+            elif len(params) > 2:
+                params = (params[0], cls[params[1:]])
+        return super(UnionMeta, cls).__getitem__(params)
     
  
 class Genericable:
+    __slots__ = ()
+
     @classmethod
     def get_actual_type(cls, generic_type):
         actual_type = cls._variable_map.get(generic_type, generic_type)
@@ -133,24 +240,89 @@ class Genericable:
             return any
         return actual_type
 
+class ValidationContext:
+    def __init__(self, max_errors=None, shared=False):
+        self.max_errors = max_errors
+        self.error_count = 0
+        self.memo = {} if shared else None
+
+    def spend(self, exception):
+        if not isinstance(exception, SchemaValidationException):
+            self.error_count += 1
+        return self.exhausted()
+
+    def exhausted(self):
+        return self.max_errors is not None and self.error_count >= self.max_errors
+
+    def branch(self):
+        if self.max_errors is None:
+            ctx = ValidationContext()
+        else:
+            ctx = ValidationContext(max_errors=self.max_errors - self.error_count)
+        ctx.memo = self.memo
+        return ctx
+
 class Type(Genericable, metaclass = TypeMeta):
     _is_type = True
     base_validators = []
-    def __init__(self, validators=[]):
+    cache = None
+    memo = None
+    def __init__(self, validators=[], cache=None):
         self.validators = list(validators)
-        self.all_validators = []
-        self.all_validators += self.base_validators
-        self.all_validators += self.validators
+        self.cache = cache
+        self.chain_validators()
+        self.bind_generics()
 
-    def validate(self, _val):
-        for validator in self.all_validators:
-            validator(_val)
-        return _val
+    def chain_validators(self):
+        self.all_validators = optimize(self.base_validators + self.validators)
+        self.checks = [checker(validator) for validator in self.all_validators]
+        if self.cache:
+            self.memo = memoize(self.checks, self.cache)
+            self.checks = [self.memo]
+
+    def cache_info(self):
+        return self.memo and self.memo.cache_info()
+
+    def cache_clear(self):
+        if self.memo is not None:
+            self.memo.cache_clear()
 
-    def __call__(self, _val):
-        self.validate(_val)
+    def bind_generics(self):
+        pass
+
+    def check(self, _val, ctx=None):
+        for check in self.checks:
+            error = check(_val)
+            if error is not None:
+                return error
+
+    validate = validate_check(check)
+
+    def __call__(self, _val, ctx=None):
+        self.validate(_val, ctx)
         return _val
 
+    def validate_only(self, _val, ctx=None):
+        error = self.check(_val, ctx)
+        if error is not None:
+            raise error
+
+    def __reduce__(self):
+        if generics_map.get(self.__class__) is self:
+            return mapped_type, (self.__class__,)
+        if self.cache:
+            return self.__class__, (self.validators, self.cache)
+        return self.__class__, (self.validators,)
+
+    def inline_validators(self):
+        cls = self.__class__
+        if self.memo is None and cls.check is Type.check and cls.validate is Type.validate and cls.__call__ is Type.__call__:
+            return self.all_validators
+        return None
+
+    def returns_input(self):
+        return self.__class__.__call__ is Type.__call__
+
 
 @map_type(typing.Any)
 class Any(Type):
@@ -176,112 +348,394 @@ map_type(bool)(Boolean)
 @map_type(typing.Dict)
 class Dictionary(Type, typing.Generic[K, V]):
     base_validators = [NoneTypeValidator(), TypesValidator((dict,))]
-    def __init__(self, validators=[]):
-        self.validators = list(validators)
-        self.all_validators = []
-        self.all_validators += self.base_validators
-        self.all_validators += self.validators
 
-    def validate(self, _val):
-        for validator in self.all_validators:
-            validator(_val)
+    def bind_generics(self):
+        self.key_type = self.get_actual_type(K)
+        self.value_type = self.get_actual_type(V)
 
-        actual_key_type = self.get_actual_type(K)
-        actual_val_type = self.get_actual_type(V)
+    def check(self, _val, ctx=None):
+        for check in self.checks:
+            error = check(_val)
+            if error is not None:
+                return error
+
+        check_key = self.key_type.check
+        check_value = self.value_type.check
         for (key, value) in _val.items():
-            actual_key_type(key)
-            actual_val_type(value)
+            error = check_key(key, ctx) or check_value(value, ctx)
+            if error is not None:
+                return error
+
+    def lazy(self, _val, ctx=None):
+        if getattr(self.value_type, "schema", None) is None:
+            return self(_val, ctx)
+        for check in self.checks:
+            error = check(_val)
+            if error is not None:
+                raise error
+        return instance.lazy.LazyDict(self.key_type, self.value_type, _val)
 
     def __repr__(self):
-        return "{{{key}: {val}}}".format(key = self.get_actual_type(K), val = self.get_actual_type(V)) 
+        return "{{{key}: {val}}}".format(key = self.key_type, val = self.value_type) 
  
 @map_type(typing.List)
 class List(Type, typing.Generic[T]):
     base_validators = [NoneTypeValidator(), TypesValidator((list,))]
 
-    def __init__(self, validators=[]):
-        self.validators = validators
-        self.all_validators = []
-        self.all_validators += self.base_validators
-        self.all_validators += self.validators
+    def bind_generics(self):
+        self.item_type = self.get_actual_type(T)
 
-    def validate(self, _val):
-        for validator in self.all_validators:
-            validator(_val)
+    def check(self, _val, ctx=None):
+        for check in self.checks:
+            error = check(_val)
+            if error is not None:
+                return error
 
-        errors = []
-        actual_type = self.get_actual_type(T)
+        errors = None
+        check = self.item_type.check
         for (index, value) in enumerate(_val):
-            try:
-                actual_type.validate(value)
-            except ValidationException as e:
-                error = e.error()
-                error["index"] = index
-                errors.append(error)
-               
+            error = check(value, ctx)
+            if error is not None:
+                details = error.error()
+                details["index"] = index
+                if errors is None:
+                    errors = []
+                errors.append(details)
+                if ctx is not None and ctx.spend(error):
+                    break
+
         if errors:
-            raise SchemaValidationException(errors)
+            return SchemaValidationException(errors)
+
+    def lazy(self, _val, ctx=None):
+        if getattr(self.item_type, "schema", None) is None:
+            return self(_val, ctx)
+        for check in self.checks:
+            error = check(_val)
+            if error is not None:
+                raise error
+        return instance.lazy.LazyList(self.item_type, _val)
 
     def __repr__(self):
-        return "[{type}]".format(type = self.get_actual_type(T)) 
+        return "[{type}]".format(type = self.item_type) 
  
  
 @map_type(typing.Optional)
 class Optional(Type, typing.Generic[T]):
-    def validate(self, val):
+    def bind_generics(self):
+        self.item_type = self.get_actual_type(T)
+
+    def check(self, val, ctx=None):
         if val != None:
-            actual_type = self.get_actual_type(T)
-            actual_type(val)
+            return self.item_type.check(val, ctx)
  
     def __repr__(self):
-        return "Optional<{type}>".format(type = self.get_actual_type(T)) 
+        return "Optional<{type}>".format(type = self.item_type) 
+
+def accepted_types(type):
+    validators = type.inline_validators()
+    for validator in validators or ():
+        if validator.__class__ is TypesValidator:
+            return validator.types
+    return None
+
+def discriminator_value(schema, key):
+    if key in schema._defaults:
+        return schema._defaults[key]
+    return getattr(schema, key, None)
 
 @map_type(typing.Union)
 class Union(Type, typing.Generic[T, K], metaclass=UnionMeta):
-    def validate(self, _val):
-        errors = []
-        for generic in (T, K):
-            actual_type = self.get_actual_type(generic)
-            try:
-                actual_type(_val)
-                return _val
-            except ValidationException as e:
-                error = e.error()
-                errors.append(error)
-        raise SchemaValidationException(errors)
+    def __init__(self, validators=[], cache=None, discriminator=None):
+        self.discriminator = discriminator
+        self.type_exception = ValidationException(2, "unexpected type")
+        self.tag_exception = ValidationException(4, "unknown {key} value".format(key=discriminator))
+        Type.__init__(self, validators, cache)
+
+    def bind_generics(self):
+        branches = []
+        for actual_type in (self.get_actual_type(T), self.get_actual_type(K)):
+            if isinstance(actual_type.__class__, UnionMeta) and actual_type.discriminator is None and not actual_type.validators:
+                branches.extend(actual_type.branches)
+            else:
+                branches.append(actual_type)
+        self.branches = tuple(branches)
+
+        untyped = []
+        dispatch = {}
+        for actual_type in self.branches:
+            types = accepted_types(actual_type)
+            if types is None:
+                untyped.append(actual_type)
+                for candidates in dispatch.values():
+                    candidates.append(actual_type)
+                continue
+            for python_type in types:
+                if python_type not in dispatch:
+                    dispatch[python_type] = list(untyped)
+                dispatch[python_type].append(actual_type)
+        self.untyped = tuple(untyped)
+        self.dispatch = {python_type: tuple(candidates) for (python_type, candidates) in dispatch.items()}
+
+        self.tags = {}
+        if self.discriminator is not None:
+            for actual_type in self.branches:
+                schema = getattr(actual_type, "schema", None)
+                if schema is None:
+                    raise TypeError("discriminated Union branch {type} is not a Schema".format(type=actual_type))
+                tag = discriminator_value(schema, self.discriminator)
+                if tag is None:
+                    raise TypeError("discriminated Union branch {type} has no {key} value".format(type=actual_type, key=self.discriminator))
+                if tag in self.tags:
+                    raise TypeError("discriminated Union branches {first} and {second} share {key} value {tag!r}".format(first=self.tags[tag], second=actual_type, key=self.discriminator, tag=tag))
+                self.tags[tag] = actual_type
+
+    def tagged(self, _val):
+        try:
+            return self.tags.get(_val.get(self.discriminator))
+        except TypeError:
+            return None
+
+    def check(self, _val, ctx=None):
+        for check in self.checks:
+            error = check(_val)
+            if error is not None:
+                return error
+
+        if self.discriminator is not None:
+            if not isinstance(_val, dict):
+                return self.type_exception
+            actual_type = self.tagged(_val)
+            if actual_type is None:
+                return self.tag_exception
+            return actual_type.check(_val, ctx)
+
+        failures = {}
+        for actual_type in self.dispatch.get(type(_val), self.untyped):
+            error = actual_type.check(_val, ctx and ctx.branch())
+            if error is None:
+                return None
+            failures[actual_type] = error
+        errors = [(failures.get(actual_type) or actual_type.check(_val, ctx and ctx.branch())).error() for actual_type in self.branches]
+        if ctx is not None:
+            ctx.error_count += 1
+        return SchemaValidationException(errors)
+
+    def __reduce__(self):
+        if self.discriminator is None:
+            return Type.__reduce__(self)
+        return self.__class__, (self.validators, self.cache, self.discriminator)
 
     def __repr__(self):
-        return "Union<{type}, {type2}>".format(type = self.get_actual_type(T), type2 = self.get_actual_type(K)) 
+        return "Union<{types}>".format(types=", ".join(repr(actual_type) for actual_type in self.branches))
  
 class SchemaType(Type):
+    base_validators = [NoneTypeValidator(), InstanceValidator((dict,))]
+
     def __init__(self, schema, validators=[]):
         self.schema = schema
         self.validators = validators
-        self.all_validators = []
-        self.all_validators += self.base_validators
-        self.all_validators += self.validators
+        self.chain_validators()
+        self.compiled = None
+        self.compiled_lazy = None
+        self.compiled_check = None
+        self.builder = None
+        self.compiled_validate = None
+        self.serializer = None
+        self.field_reader = None
+        self.codecs = {}
+        self.fingerprint = None
+        self.snapshot = compile_snapshot(schema)
+        self.positions = {key: idx for (idx, key) in enumerate(schema.__annotations__)}
+
+    def __call__(self, _val, ctx=None, fields=None, lazy=False, iterative=False, **options):
+        if options:
+            ctx = ValidationContext(**options)
+        if fields is not None:
+            return instance.projection.from_json_fields(self, _val, fields, ctx)
+        if iterative:
+            return instance.iterative.from_json(self, _val, ctx)
+        if ctx is not None and ctx.memo is not None and not lazy:
+            return instance.shared.from_json(self, _val, ctx)
+        if instance.metrics.enabled and not lazy:
+            return instance.metrics.from_json(self, _val, ctx)
+        for check in self.checks:
+            error = check(_val)
+            if error is not None:
+                raise error
+        if lazy:
+            if self.compiled_lazy is None:
+                self.compiled_lazy = compile_from_json(self.schema, lazy=True)
+            return self.compiled_lazy(_val, ctx)
+        if self.compiled is not None:
+            return self.compiled(_val, ctx)
+        return self.interpret(_val, ctx)
+
+    def lazy(self, _val, ctx=None):
+        return self(_val, ctx, lazy=True)
+
+    def to_json(self, obj):
+        if self.serializer is None:
+            self.serializer = compile_to_json(self.schema)
+        return self.serializer(obj)
+
+    def fields(self, obj):
+        if self.field_reader is None:
+            self.field_reader = compile_fields(self.schema)
+        return self.field_reader(obj)
+
+    def check(self, _val, ctx=None):
+        if ctx is not None and ctx.memo is not None:
+            return instance.shared.check(self, _val, ctx)
+        if instance.metrics.enabled:
+            return instance.metrics.check(self, _val, ctx)
+        for check in self.checks:
+            error = check(_val)
+            if error is not None:
+                return error
+        if self.compiled_check is not None:
+            return self.compiled_check(_val, ctx)
+        return self.interpret_check(_val, ctx)
+
+    def validate_only(self, _val, ctx=None, iterative=False, **options):
+        if options:
+            ctx = ValidationContext(**options)
+        if iterative:
+            error = instance.iterative.check(self, _val, ctx)
+        else:
+            error = self.check(_val, ctx)
+        if error is not None:
+            raise error
+
+    def compile(self):
+        self.compiled = compile_from_json(self.schema)
+        self.compiled_check = compile_check(self.schema)
+        self.builder = compile_builder(self.schema)
+        self.compiled_validate = compile_validate(self.schema)
 
-    def __call__(self, _val):
-        self.validate(_val)
+    def interpret(self, _val, ctx=None):
         obj = self.schema()
+        defaults = self.schema._defaults
         errors = {}
         for (key, type) in self.schema.__annotations__.items():
             if key in _val:
                 val = _val.get(key, None)
+            elif key in defaults:
+                val = defaults[key]
             else:
                 val = getattr(obj, key, None)
             try:
-                new_val = type(val)
+                new_val = type(val, ctx)
                 setattr(obj, key, new_val)
             except ValidationException as e:
                 errors[key] = e.error()
+                if ctx is not None and ctx.spend(e):
+                    break
         if errors:
             raise SchemaValidationException(errors)
+        obj._validated = self.snapshot(obj)
         return obj
 
+    def interpret_check(self, _val, ctx=None):
+        errors = None
+        for (key, type) in self.schema.__annotations__.items():
+            if key in _val:
+                val = _val.get(key, None)
+            elif key in self.schema._defaults:
+                val = self.schema._defaults[key]
+            else:
+                val = getattr(self.schema, key, None)
+            error = type.check(val, ctx)
+            if error is not None:
+                if errors is None:
+                    errors = {}
+                errors[key] = error.error()
+                if ctx is not None and ctx.spend(error):
+                    break
+        if errors:
+            return SchemaValidationException(errors)
+
+    def interpret_validate_only(self, _val, ctx=None):
+        error = self.interpret_check(_val, ctx)
+        if error is not None:
+            raise error
+
+    def __reduce__(self):
+        return getattr, (self.schema, "from_json")
+
     def __repr__(self):
         return "<SchemaType[{schema}]>".format(schema=self.schema) 
 
+deferred_schemas = []
+
+def forward_reference(annotation):
+    if isinstance(annotation, (str, typing._ForwardRef)):
+        return True
+    if isinstance(annotation, Type):
+        return False
+    for arg in getattr(annotation, "__args__", None) or ():
+        if forward_reference(arg):
+            return True
+    return False
+
+def deferred_reference(annotation):
+    if getattr(annotation, "is_schema", False):
+        return annotation.__dict__.get("from_json") is finalizer
+    if isinstance(annotation, Type):
+        return False
+    for arg in getattr(annotation, "__args__", None) or ():
+        if deferred_reference(arg):
+            return True
+    return False
+
+def resolve_forward_reference(annotation, namespace):
+    if isinstance(annotation, str):
+        return eval(annotation, namespace)
+    if isinstance(annotation, typing._ForwardRef):
+        return eval(annotation.__forward_arg__, namespace)
+    if not forward_reference(annotation):
+        return annotation
+    args = tuple(resolve_forward_reference(arg, namespace) for arg in annotation.__args__)
+    return annotation.__origin__[args]
+
+def finalize_parents(parents):
+    for parent in parents:
+        if getattr(parent, "is_schema", False):
+            parent.from_json
+
+def finalize(schema):
+    from_json = schema.__dict__.get("from_json")
+    if from_json is not finalizer:
+        return from_json
+    finalize_parents(schema.__bases__)
+    from_json = SchemaType(schema)
+    type.__setattr__(schema, "from_json", from_json)
+    try:
+        meta = schema.__class__
+        namespace = dict(sys.modules[schema.__module__].__dict__)
+        namespace[schema.__name__] = schema
+        annotations = {}
+        for (annotation_name, annotation_type) in schema.__deferred_annotations__.items():
+            annotation_type = resolve_forward_reference(annotation_type, namespace)
+            annotations[annotation_name] = meta.__get_annotation_type__(meta, annotation_type, schema._variable_map)
+        type.__setattr__(schema, "__annotations__", meta.__merge_annotations__(meta, annotations, schema.__bases__))
+        from_json.compile()
+    except Exception:
+        type.__setattr__(schema, "from_json", finalizer)
+        raise
+    return from_json
+
+def finalize_all():
+    while deferred_schemas:
+        deferred_schemas[-1].from_json
+        deferred_schemas.pop()
+
+class Finalizer:
+    def __get__(self, obj, owner):
+        return finalize(owner)
+
+finalizer = Finalizer()
+
 class SchemaMeta(TypeMeta):
     def __merge_annotations__(cls, annotations, parents):
         parents_annotations = {}
@@ -308,17 +762,40 @@ class SchemaMeta(TypeMeta):
         new_annotation_arguments = tuple(new_annotation_arguments)
         if new_annotation_arguments and new_annotation_arguments != old_annotation_arguments:
             validators = merge_validators(annotation_type, new_annotation)
-            new_annotation = new_annotation.__origin__[new_annotation_arguments](validators=validators)
+            new_annotation = parameterized_type(new_annotation.__origin__, new_annotation_arguments, validators)
 
         return new_annotation
 
+    def __merge_defaults__(cls, parents):
+        defaults = {}
+        for parent in reversed(parents):
+            defaults.update(getattr(parent, "_defaults", {}))
+        return defaults
+
+    def __create_slots__(cls, dct, annotations, parents, defaults):
+        taken = set()
+        for parent in parents:
+            for base in parent.__mro__:
+                base_slots = base.__dict__.get("__slots__", ())
+                taken.update(isinstance(base_slots, str) and (base_slots,) or base_slots)
+
+        slots = []
+        for key in annotations:
+            if key in dct:
+                defaults[key] = dct.pop(key)
+            elif key not in taken:
+                defaults[key] = next((getattr(parent, key) for parent in parents if hasattr(parent, key)), None)
+            if key not in taken:
+                slots.append(key)
+        return tuple(slots)
+
     def __get_annotation_type__(cls, annotation_type, types_map):
         if annotation_type.__class__ == typing.TypeVar:
             return types_map.get(annotation_type, annotation_type)
         else:    
             return cls.__convert_annotation_type__(cls, annotation_type, types_map)
 
-    def __new__(cls, name, parents, dct, **kwargs):
+    def __new__(cls, name, parents, dct, slots=None, deferred=None, **kwargs):
         args = kwargs.get("args", [])
         parameters = dct.get("__parameters__", [])
         new_args = []
@@ -334,46 +811,122 @@ class SchemaMeta(TypeMeta):
         if new_args:
             kwargs["args"] = new_args
 
-        annotations = dict(dct.get("__annotations__", {}))
-
-        for annotation_name, annotation_type in annotations.items():
-            annotations[annotation_name] = cls.__get_annotation_type__(cls, annotation_type, types_map)
-        
+        if new_args and "__deferred_annotations__" in dct:
+            annotations = dict(dct["__deferred_annotations__"])
+        else:
+            annotations = dict(dct.get("__annotations__", {}))
+
+        if deferred is None:
+            deferred = bool([parent for parent in parents if getattr(parent, "__schema_deferred__", False)])
+        if parameters or new_args:
+            deferred = bool([annotation for annotation in annotations.values() if forward_reference(annotation)])
+        elif deferred:
+            dct["__schema_deferred__"] = True
+        else:
+            deferred = bool([annotation for annotation in annotations.values() if forward_reference(annotation) or deferred_reference(annotation)])
+            deferred = deferred or bool([parent for parent in parents if deferred_reference(parent)])
+        if deferred:
+            dct["__deferred_annotations__"] = dict(annotations)
+            dct["from_json"] = finalizer
+        else:
+            finalize_parents(parents)
+            for annotation_name, annotation_type in annotations.items():
+                annotations[annotation_name] = cls.__get_annotation_type__(cls, annotation_type, types_map)
 
         dct["__annotations__"] = cls.__merge_annotations__(cls, annotations, parents)
 
+        defaults = cls.__merge_defaults__(cls, parents)
+        if slots is None:
+            slots = dct.get("__schema_slots__", False)
+        if slots:
+            dct["__slots__"] = cls.__create_slots__(cls, dct, dct["__annotations__"], parents, defaults)
+            dct["__schema_slots__"] = True
+            if "__init__" not in dct and not [parent for parent in parents if parent.__init__ not in (object.__init__, fill_slots)]:
+                dct["__init__"] = fill_slots
+        else:
+            for key in dct["__annotations__"]:
+                if key in dct:
+                    defaults.pop(key, None)
+        dct["_defaults"] = defaults
+
         obj = super(SchemaMeta, cls).__new__(cls, name, parents, dct, **kwargs)
-        obj.from_json = SchemaType(obj)
+        if deferred:
+            deferred_schemas.append(obj)
+        else:
+            from_json = SchemaType(obj)
+            from_json.compile()
+            type.__setattr__(obj, "from_json", from_json)
 
         return obj
 
+    def __init__(cls, name, parents, dct, slots=None, deferred=None, **kwargs):
+        super(SchemaMeta, cls).__init__(name, parents, dct, **kwargs)
+
 class Schema(Genericable, metaclass=SchemaMeta):
+    __slots__ = ("_validated",)
     is_schema = True
 
-    def validate(self):
-        errors = {}
-        print(self.__annotations__)
-        for (key, type) in self.__annotations__.items():
-            val = getattr(self, key, None)
-            try:
-                if(getattr(val, "is_schema", False)):
-                    val.validate()
-                else:
-                    type(val)
-            except ValidationException as e:
-                errors[key] = e.error()
+    @classmethod
+    def check(cls, payload, iterative=False, **options):
+        ctx = options and ValidationContext(**options) or None
+        if iterative:
+            error = instance.iterative.check(cls.from_json, payload, ctx)
+        else:
+            error = cls.from_json.check(payload, ctx)
+        if error is not None:
+            return error.error()
+        return None
 
-        if errors:
-            raise SchemaValidationException(errors)
+    @classmethod
+    def from_json_bytes(cls, buf, **options):
+        ctx = options and ValidationContext(**options) or None
+        return instance.decoder.from_json_bytes(cls.from_json, buf, ctx)
+
+    @classmethod
+    def from_json_many(cls, records):
+        return instance.batch.from_json_many(cls.from_json, records)
+
+    @classmethod
+    def from_json_parallel(cls, records, workers=None, chunksize=1000):
+        return instance.parallel.from_json_parallel(cls.from_json, records, workers, chunksize)
+
+    @classmethod
+    def apply_patch(cls, obj, delta, copy=False):
+        return instance.patch.apply_patch(cls.from_json, obj, delta, copy)
+
+    @classmethod
+    def iter_validate(cls, source, chunk_size=65536, **options):
+        return instance.stream.iter_validate(cls.from_json, source, chunk_size, **options)
+
+    def validate(self, full=False):
+        self.from_json.compiled_validate(self, full)
+
+    def __getstate__(self):
+        slots = {key: getattr(self, key) for key in copyreg._slotnames(self.__class__) if hasattr(self, key)}
+        return getattr(self, "__dict__", None), slots
+
+    def __setstate__(self, state):
+        values, slots = state
+        for (key, val) in list((values or {}).items()) + list(slots.items()):
+            setattr(self, key, val)
 
     def to_json(self):
-        json = {}
-        for (key, type) in self.__annotations__.items():
-            val = getattr(self, key, None)
-            if getattr(val, "is_schema", False):
-                json[key] = val.to_json()
-            else:
-                json[key] = val
-        return json
+        return self.from_json.to_json(self)
+
+    def to_json_string(self):
+        return instance.serialize.to_json_string(self)
+
+    def dump(self, fp):
+        instance.serialize.dump(self, fp)
+
+    def to_bytes(self):
+        return instance.binary.to_bytes(self.from_json, self)
+
+    @classmethod
+    def from_bytes(cls, buf, trusted=True):
+        return instance.binary.from_bytes(cls.from_json, buf, trusted)
+
+for meta in (TypeMeta, UnionMeta, SchemaMeta):
+    copyreg.pickle(meta, reduce_type_class)
 
-__all__ = ['Any', 'Optional', 'Integer', 'Double', 'String', 'Boolean', 'List', 'Dictionary', 'Union', 'create_validated_type', 'mapped_type', 'Schema']
+__all__ = ['Any', 'Optional', 'Integer', 'Double', 'String', 'Boolean', 'List', 'Dictionary', 'Union', 'create_validated_type', 'mapped_type', 'Schema', 'finalize_all']
@@ -22,6 +22,8 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import functools
+
 class ValidationException(Exception):
     def __init__(self, code, msg):
         self.code = code
@@ -33,6 +35,9 @@ class ValidationException(Exception):
             "message": self.msg
         }
 
+    def __reduce__(self):
+        return self.__class__, (self.code, self.msg)
+
 class SchemaValidationException(ValidationException):
     def __init__(self, errors):
         self.errors = errors
@@ -40,26 +45,73 @@ class SchemaValidationException(ValidationException):
     def error(self):
         return self.errors
 
+    def __reduce__(self):
+        return self.__class__, (self.errors,)
+
 class Validator:
     def __call__(self, val):
+        error = self.check(val)
+        if error is not None:
+            raise error
+
+    def check(self, val):
         raise Exception("Uniplemented Validator")
 
+def checker(validator):
+    if isinstance(validator, Validator) and validator.__class__.check is not Validator.check:
+        return validator.check
+
+    def check(val):
+        try:
+            validator(val)
+        except ValidationException as e:
+            return e
+    return check
+
+def memoize(checks, size):
+    def run(val):
+        for check in checks:
+            error = check(val)
+            if error is not None:
+                return error
+
+    cached = functools.lru_cache(maxsize=size, typed=True)(run)
+
+    def check(val):
+        try:
+            hash(val)
+        except TypeError:
+            return run(val)
+        return cached(val)
+    check.cache_info = cached.cache_info
+    check.cache_clear = cached.cache_clear
+    return check
+
 class NoneTypeValidator(Validator):
     def __init__(self):
         self.none_type_exception = ValidationException(1, "None type not permitted")
 
-    def __call__(self, val):
+    def check(self, val):
         if val == None:
-            raise self.none_type_exception
+            return self.none_type_exception
 
 class TypesValidator(Validator):
     def __init__(self, types):
         self.types = types
         self.none_type_exception = ValidationException(2, "unexpected type")
 
-    def __call__(self, val):
+    def check(self, val):
         if type(val) not in self.types:
-            raise self.none_type_exception
+            return self.none_type_exception
+
+class InstanceValidator(Validator):
+    def __init__(self, types):
+        self.types = types
+        self.none_type_exception = ValidationException(2, "unexpected type")
+
+    def check(self, val):
+        if not isinstance(val, self.types):
+            return self.none_type_exception
 
 class ValueValidator(Validator):
     base_operator = ">"
@@ -74,29 +126,106 @@ class ValueValidator(Validator):
 class MaxValidator(ValueValidator):
     base_error = "value must be {operator} {limit}"
 
-    def __call__(self, val):
+    def check(self, val):
         if val > self.limit or val == self.limit and not self.inclusive:
-            raise self.exception
+            return self.exception
 
 class MinValidator(ValueValidator):
     base_operator = "<"
     base_error = "value must be {operator} {limit}"
 
-    def __call__(self, val):
+    def check(self, val):
         if val < self.limit or val == self.limit and not self.inclusive:
-            raise self.exception
+            return self.exception
 
 class MaxLengthValidator(ValueValidator):
     base_error = "value must have length {operator} {limit}"
 
-    def __call__(self, val):
+    def check(self, val):
         if len(val) > self.limit or len(val) == self.limit and not self.inclusive:
-            raise self.exception
+            return self.exception
 
 class MinLengthValidator(ValueValidator):
     base_operator = "<"
     base_error = "value must have length {operator} {limit}"
 
-    def __call__(self, val):
+    def check(self, val):
         if len(val) < self.limit or len(val) == self.limit and not self.inclusive:
-            raise self.exception
+            return self.exception
+
+class RangeValidator(Validator):
+    def __init__(self, minimum, maximum):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.lower = minimum.limit
+        self.lower_inclusive = minimum.inclusive
+        self.upper = maximum.limit
+        self.upper_inclusive = maximum.inclusive
+
+    def parts(self):
+        return (self.minimum, self.maximum)
+
+    def check(self, val):
+        if val < self.lower or val == self.lower and not self.lower_inclusive:
+            return self.minimum.exception
+        if val > self.upper or val == self.upper and not self.upper_inclusive:
+            return self.maximum.exception
+
+class LengthRangeValidator(RangeValidator):
+    def check(self, val):
+        length = len(val)
+        if length < self.lower or length == self.lower and not self.lower_inclusive:
+            return self.minimum.exception
+        if length > self.upper or length == self.upper and not self.upper_inclusive:
+            return self.maximum.exception
+
+ranges = {
+    (MinValidator, MaxValidator): RangeValidator,
+    (MinLengthValidator, MaxLengthValidator): LengthRangeValidator,
+}
+
+def validator_key(validator):
+    cls = validator.__class__
+    if cls is NoneTypeValidator:
+        return (cls,)
+    if cls is TypesValidator or cls is InstanceValidator:
+        return (cls, tuple(validator.types))
+    if cls in (MaxValidator, MinValidator, MaxLengthValidator, MinLengthValidator):
+        return (cls, validator.limit, validator.inclusive)
+    return (Validator, id(validator))
+
+def disjoint(minimum, maximum):
+    return minimum.limit < maximum.limit or minimum.limit == maximum.limit and minimum.inclusive and maximum.inclusive
+
+def fuse(first, second):
+    fused = ranges.get((first.__class__, second.__class__))
+    if fused is not None and disjoint(first, second):
+        return fused(first, second)
+    fused = ranges.get((second.__class__, first.__class__))
+    if fused is not None and disjoint(second, first):
+        return fused(second, first)
+    return None
+
+def optimize(validators):
+    seen = set()
+    chain = []
+    for validator in validators:
+        key = validator_key(validator)
+        if key in seen:
+            continue
+        seen.add(key)
+        fused = chain and fuse(chain[-1], validator)
+        if fused:
+            chain[-1] = fused
+        else:
+            chain.append(validator)
+    return chain
+
+def expand(validators):
+    expanded = []
+    for validator in validators:
+        if isinstance(validator, RangeValidator):
+            expanded.extend(validator.parts())
+        else:
+            expanded.append(validator)
+    return expanded
@@ -0,0 +1,84 @@
+"""
+MIT License
+
+Copyright (c) 2017 Brandon Hoffman
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from instance.types import *
+from instance.validators import *
+import instance.batch
+import pytest
+import typing
+from helpers import starts_capital
+
+class Owner(Schema):
+    name: String(validators=[starts_capital])
+
+class Car(Schema):
+    make: String(validators=[MinLengthValidator(2), MaxLengthValidator(8, inclusive=False)])
+    year: Integer(validators=[MinValidator(1950), MaxValidator(2017)])
+    price: Double(validators=[MinValidator(0, inclusive=False)])
+    electric: bool = False
+    owner: typing.Optional[Owner]
+
+records = [
+    {'make': 'Toyota', 'year': 2007, 'price': 1.5},
+    {'make': 'T', 'year': 1949, 'price': 0},
+    {'make': 'Mercedes', 'year': 2018, 'price': -1, 'electric': 1},
+    {'make': None, 'year': '2007', 'price': 'x', 'owner': {'name': 'joe'}},
+    {'make': 'Ford', 'year': 2017, 'price': 3, 'electric': True, 'owner': {'name': 'Joe'}},
+    None,
+    {},
+]
+
+def expected():
+    objects = []
+    errors = {}
+    for (idx, record) in enumerate(records):
+        try:
+            objects.append(Car.from_json(record).to_json())
+        except ValidationException as e:
+            objects.append(None)
+            errors[idx] = e.error()
+    return objects, errors
+
+class TestFromJsonMany:
+    def check(self):
+        objects, errors = Car.from_json_many(records)
+        expected_objects, expected_errors = expected()
+        assert(errors == expected_errors)
+        assert([obj and obj.to_json() for obj in objects] == expected_objects)
+        assert(isinstance(objects[0], Car))
+
+    def test_pure_python(self):
+        numpy = instance.batch.numpy
+        instance.batch.numpy = None
+        try:
+            self.check()
+        finally:
+            instance.batch.numpy = numpy
+
+    def test_numpy(self):
+        pytest.importorskip("numpy")
+        assert(instance.batch.numpy is not None)
+        self.check()
+
+    def test_empty(self):
+        assert(Car.from_json_many([]) == ([], {}))
@@ -0,0 +1,124 @@
+"""
+MIT License
+
+Copyright (c) 2017 Brandon Hoffman
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from instance.types import *
+from instance.validators import *
+import instance.binary
+import pytest
+import typing
+
+class Rider(Schema):
+    name: String(validators=[MinLengthValidator(2)])
+    age: int = 30
+
+class Sticker(Schema):
+    kind: str = "sticker"
+    label: str
+
+class Memo(Schema):
+    kind: str = "memo"
+    text: str
+
+class Bike(Schema):
+    make: str
+    year: int
+    price: float
+    electric: bool = False
+    rider: Rider
+    passengers: typing.List[Rider] = []
+    extras: typing.Dict[str, typing.Optional[int]] = {}
+    note: typing.Optional[str] = None
+    attached: Union[Sticker, Memo](discriminator="kind") = None
+    size: Union[int, str] = 0
+    anything: typing.Any = None
+
+class OtherBike(Schema):
+    make: str
+    year: int
+
+class TreeNode(Schema):
+    name: str
+    children: typing.List['TreeNode'] = []
+    parent: typing.Optional['TreeNode'] = None
+
+payload = {
+    'make': 'Trek',
+    'year': 2 ** 70,
+    'price': 1.5,
+    'rider': {'name': 'Joe'},
+    'passengers': [{'name': 'Al', 'age': 3}, {'name': 'Bo'}],
+    'extras': {'a': None, 'b': -2},
+    'attached': {'kind': 'memo', 'text': 'hi'},
+    'size': 'large',
+    'anything': {'x': [1, 'y']},
+}
+
+class TestBinary:
+    def test_round_trip(self):
+        bike = Bike.from_json(payload)
+        data = bike.to_bytes()
+        assert(type(data) is bytes)
+        assert(len(data) < len(bike.to_json_string()))
+        for buf in (data, bytearray(data), memoryview(data)):
+            assert(Bike.from_bytes(buf).to_json() == bike.to_json())
+
+    def test_trusted_objects(self):
+        bike = Bike.from_bytes(Bike.from_json(payload).to_bytes())
+        assert(isinstance(bike.rider, Rider))
+        assert(bike.rider.age == 30)
+        assert(bike.passengers[1] == {'name': 'Bo'})
+        bike.validate()
+        bike.year = 2000
+        bike.validate()
+
+    def test_untrusted(self):
+        bike = Bike.from_json(payload)
+        bike.rider.name = "J"
+        with pytest.raises(ValidationException) as e:
+            Bike.from_bytes(bike.to_bytes(), trusted=False)
+        assert(e.value.error() == {"rider": {"name": {"code": 6, "message": "value must have length <= 2"}}})
+
+    def test_lazy(self):
+        bike = Bike.from_json(payload, lazy=True)
+        bike.passengers[0]
+        assert(Bike.from_bytes(bike.to_bytes()).to_json() == Bike.from_json(payload).to_json())
+
+    def test_fingerprint(self):
+        data = OtherBike.from_json({'make': 'Trek', 'year': 2000}).to_bytes()
+        with pytest.raises(ValidationException) as e:
+            Bike.from_bytes(data)
+        assert(e.value.error() == {"code": 5, "message": "schema fingerprint mismatch"})
+        assert(OtherBike.from_bytes(data).year == 2000)
+
+    def test_invalid_data(self):
+        data = Bike.from_json(payload).to_bytes()
+        for buf in (data[:-1], data + b"\x00", data[:12]):
+            with pytest.raises(ValidationException) as e:
+                Bike.from_bytes(buf)
+            assert(e.value.error() == {"code": 5, "message": "invalid binary data"})
+
+    def test_recursive(self):
+        tree = {'name': 'a', 'children': [{'name': 'b', 'children': [{'name': 'c'}]}], 'parent': {'name': 'root'}}
+        node = TreeNode.from_json(tree)
+        assert(TreeNode.from_bytes(node.to_bytes()).to_json() == node.to_json())
+        assert("^TreeNode" in instance.binary.describe(TreeNode.from_json))
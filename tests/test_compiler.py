@@ -0,0 +1,101 @@
+"""
+MIT License
+
+Copyright (c) 2017 Brandon Hoffman
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from instance.types import *
+from instance.validators import *
+import typing
+from helpers import outcome, starts_capital
+
+year = create_validated_type("year", Integer, [MinValidator(1950), MaxValidator(2017, inclusive=False)])
+
+class Person(Schema):
+    name: String(validators=[starts_capital, MinLengthValidator(2)])
+    age: int = 30
+
+class Car(Schema):
+    make: str
+    model: String(validators=[MaxLengthValidator(10)])
+    year: year
+    price: float
+    electric: bool = False
+    owner: Person
+    passengers: typing.List[str] = []
+
+class TestCompiledSchema:
+    cases = [
+        {'make': 'Toyota', 'model': 'Corolla', 'year': 2007, 'price': 1, 'owner': {'name': 'Joe'}},
+        {'make': 'Toyota', 'model': 'Corolla', 'year': 2007, 'price': 1.5, 'electric': True, 'owner': {'name': 'Joe', 'age': 40}, 'passengers': ['a']},
+        {'make': None, 'model': 'Corolla Hatchback', 'year': 1949, 'price': '1', 'owner': {'name': 'joe'}},
+        {'make': 1, 'model': 1, 'year': 2017, 'price': None, 'electric': 1, 'owner': {'name': 'J', 'age': 1.0}, 'passengers': [1]},
+        {'owner': {}},
+    ]
+
+    def test_compiled(self):
+        assert(Car.from_json.compiled is not None)
+        assert("_t" in Car.from_json.compiled.__source__)
+
+    def test_matches_interpreter(self):
+        for case in self.cases:
+            assert(outcome(Car.from_json, case) == outcome(Car.from_json.interpret, case))
+
+    def test_validate_only_matches_interpreter(self):
+        for case in self.cases:
+            compiled = Car.check(case)
+            try:
+                Car.from_json.interpret_validate_only(case)
+                interpreted = None
+            except ValidationException as e:
+                interpreted = e.error()
+            assert(compiled == interpreted)
+            if compiled is None:
+                assert(outcome(Car.from_json, case) == Car.from_json(case).to_json())
+
+    def test_inlined_errors(self):
+        errors = outcome(Car.from_json, self.cases[2])
+        assert(errors["make"] == {"code": 1, "message": "None type not permitted"})
+        assert(errors["model"] == {"code": 6, "message": "value must have length >= 10"})
+        assert(errors["year"] == {"code": 6, "message": "value must be <= 1950"})
+        assert(errors["price"] == {"code": 2, "message": "unexpected type"})
+        assert(errors["owner"] == {"name": {"code": 431, "message": "Must start with capital letter"}})
+
+    def test_defaults(self):
+        car = Car.from_json(self.cases[0])
+        assert(car.electric == False)
+        assert(car.passengers == [])
+        assert(car.owner.age == 30)
+
+    def test_non_inlinable(self):
+        for type in Person.__annotations__.values():
+            assert(type.inline_validators() is not None)
+        assert(Car.__annotations__["owner"].inline_validators() is None)
+        assert(Car.__annotations__["passengers"].inline_validators() is None)
+
+Wide = type(Schema)("Wide", (Schema,), {"__annotations__": {"field{idx}".format(idx=idx): int for idx in range(300)}, "__module__": __name__})
+
+class TestWideSchema:
+    def test_more_than_255_fields(self):
+        payload = {"field{idx}".format(idx=idx): idx for idx in range(300)}
+        wide = Wide.from_json(payload)
+        assert(wide.to_json() == payload)
+        assert(Wide.from_json_many([payload])[0][0].to_json() == payload)
+        assert(Wide.from_bytes(wide.to_bytes()).to_json() == payload)
@@ -0,0 +1,93 @@
+"""
+MIT License
+
+Copyright (c) 2017 Brandon Hoffman
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from instance.types import *
+from instance.validators import *
+import json
+import pytest
+import typing
+from helpers import outcome
+
+class Owner(Schema):
+    name: String(validators=[MinLengthValidator(2)])
+    age: int = 30
+
+class Vehicle(Schema):
+    make: str
+    year: Integer(validators=[MinValidator(1950)])
+    price: float
+    electric: bool = False
+    owner: Owner
+    passengers: typing.List[str] = []
+
+class TestFromJsonBytes:
+    cases = [
+        {'make': 'Toyota', 'year': 2007, 'price': 1, 'owner': {'name': 'Joe'}},
+        {'make': 'Toyota', 'year': 2007, 'price': 1.5, 'electric': True, 'owner': {'name': 'Joe', 'age': 40}, 'passengers': ['a']},
+        {'make': None, 'year': 1949, 'price': '1', 'owner': {'name': 'J'}},
+        {'make': 1, 'year': "2017", 'price': None, 'electric': 1, 'owner': {'age': 1.0}, 'passengers': [1]},
+        {'owner': None},
+        {'owner': {}, 'extra': {'nested': [1, 2, {'deep': None}]}},
+    ]
+
+    def test_matches_from_json(self):
+        for case in self.cases:
+            buf = json.dumps(case).encode("utf-8")
+            assert(outcome(Vehicle.from_json_bytes, buf) == outcome(Vehicle.from_json, case))
+
+    def test_buffers(self):
+        buf = json.dumps(self.cases[1]).encode("utf-8")
+        for value in (buf, bytearray(buf), memoryview(buf), buf.decode("utf-8")):
+            assert(Vehicle.from_json_bytes(value).to_json() == Vehicle.from_json(self.cases[1]).to_json())
+
+    def test_unknown_keys_skipped(self):
+        vehicle = Vehicle.from_json_bytes(b' { "extra" : {"a": [1, "}"]}, "make": "Ford", "year": 1990, "price": 2, "owner": {"name": "Al", "x": 1} } ')
+        assert(vehicle.make == "Ford")
+        assert(vehicle.owner.name == "Al")
+        assert(not hasattr(vehicle, "extra"))
+
+    def test_token_rejection(self):
+        with pytest.raises(ValidationException) as e:
+            Vehicle.from_json_bytes(b'{"make": ["a", "b"], "year": 2000, "price": 1, "owner": {"name": "Al"}}')
+        assert(e.value.error() == {"make": {"code": 2, "message": "unexpected type"}})
+
+    def test_revalidation_snapshot(self):
+        vehicle = Vehicle.from_json_bytes(json.dumps(self.cases[0]).encode("utf-8"))
+        assert(vehicle._validated is not None)
+        vehicle.validate()
+
+    def test_invalid_json(self):
+        for buf in (b'{"make": "Ford",}', b'{"make" "Ford"}', b'{"make": "Ford"} x', b'{"make": tru}', b'{', b'{"make": "\xff"}', memoryview(b'{"make": "\xff"}')):
+            with pytest.raises(ValidationException) as e:
+                Vehicle.from_json_bytes(buf)
+            assert(e.value.error() == {"code": 3, "message": "invalid json"})
+
+    def test_not_an_object(self):
+        with pytest.raises(ValidationException) as e:
+            Vehicle.from_json_bytes(b'null')
+        assert(e.value.error() == {"code": 1, "message": "None type not permitted"})
+
+    def test_max_errors(self):
+        with pytest.raises(ValidationException) as e:
+            Vehicle.from_json_bytes(json.dumps(self.cases[3]).encode("utf-8"), max_errors=1)
+        assert(len(e.value.error()) == 1)
@@ -0,0 +1,147 @@
+"""
+MIT License
+
+Copyright (c) 2017 Brandon Hoffman
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from instance.types import *
+from instance.validators import ValidationException
+import instance
+import instance.types
+import pickle
+import pytest
+import typing
+
+class Model(Schema, deferred=True):
+    pass
+
+class Branch(Model):
+    name: str
+    children: typing.List['Branch'] = []
+    parent: typing.Optional['Branch'] = None
+
+class Keeper(Model):
+    name: str
+    pets: typing.List['Pet'] = []
+
+class Pet(Model):
+    name: str
+    keeper: 'Keeper'
+
+class Twig(Branch):
+    leaves: int = 0
+
+class Early(Schema):
+    value: int
+    late: 'Late' = None
+
+class Late(Schema):
+    value: int
+
+class Husband(Schema):
+    name: str
+    spouse: typing.Optional['Wife'] = None
+
+class Wife(Schema):
+    name: str
+    spouse: typing.Optional[Husband] = None
+
+class Unresolved(Model):
+    value: 'Missing'
+
+class Untouched(Model):
+    value: int
+
+def finalized(schema):
+    return isinstance(schema.__dict__["from_json"], instance.types.SchemaType)
+
+class TestDeferred:
+    def test_deferred_until_first_use(self):
+        assert(not finalized(Untouched))
+        assert(Untouched.__annotations__ == {"value": int})
+        assert(Untouched.from_json({"value": 1}).value == 1)
+        assert(finalized(Untouched))
+        assert(Untouched.__annotations__["value"] is mapped_type(int))
+
+    def test_eager_by_default(self):
+        class Plain(Schema):
+            value: int
+        assert(finalized(Plain))
+
+    def test_self_reference(self):
+        payload = {'name': 'a', 'children': [{'name': 'b', 'children': [{'name': 'c'}]}], 'parent': {'name': 'p'}}
+        assert(Branch.from_json(payload).to_json() == payload)
+        with pytest.raises(ValidationException) as e:
+            Branch.from_json({'name': 'a', 'children': [{'name': 1}]})
+        assert(e.value.error() == {'children': [{'name': {'code': 2, 'message': 'unexpected type'}, 'index': 0}]})
+
+    def test_mutual_reference(self):
+        pet = Pet.from_json({'name': 'rex', 'keeper': {'name': 'al', 'pets': [{'name': 'tom', 'keeper': {'name': 'bo'}}]}})
+        assert(isinstance(pet.keeper, Keeper))
+        assert(pet.keeper.pets[0]['keeper'] == {'name': 'bo'})
+
+    def test_forward_reference_defers(self):
+        assert(Early.from_json({'value': 1, 'late': {'value': 2}}).late.value == 2)
+
+    def test_reference_to_deferred(self):
+        assert(not finalized(Wife))
+        assert(Wife.from_json({'name': 'a', 'spouse': {'name': 'b', 'spouse': {'name': 'a'}}}).name == 'a')
+        assert(Wife.check({'name': 'a', 'spouse': {'name': 'b', 'spouse': {'name': 1}}}) == {'spouse': {'spouse': {'name': {'code': 2, 'message': 'unexpected type'}}}})
+        assert(Husband.check({'name': 'b', 'spouse': {'name': 1}}) == {'spouse': {'name': {'code': 2, 'message': 'unexpected type'}}})
+
+    def test_generic_self_reference(self):
+        T = typing.TypeVar("T")
+        class Box(Schema, typing.Generic[T]):
+            value: T
+            child: typing.Optional['Box'] = None
+
+        assert(Box[int].check({'value': 1, 'child': {'value': 2}}) is None)
+        assert(Box[int].check({'value': 1, 'child': {'value': 'x'}}) == {'child': {'value': {'code': 2, 'message': 'unexpected type'}}})
+        assert(Box[str].check({'value': 'x', 'child': {'value': 'y'}}) is None)
+        assert(Box[int].__annotations__['child'].item_type is Box[int].from_json)
+
+    def test_inheritance(self):
+        twig = Twig.from_json({'name': 'x', 'children': [{'name': 'y'}]})
+        assert(list(Twig.__annotations__) == ['name', 'children', 'parent', 'leaves'])
+        assert(twig.leaves == 0)
+        assert(pickle.loads(pickle.dumps(twig)).to_json() == twig.to_json())
+
+    def test_validate_before_finalize(self):
+        twig = Twig()
+        twig.name = "x"
+        twig.children = []
+        twig.parent = None
+        twig.leaves = "1"
+        with pytest.raises(ValidationException):
+            twig.validate()
+
+    def test_unresolved(self):
+        for _ in range(2):
+            with pytest.raises(NameError):
+                Unresolved.from_json
+        assert(not finalized(Unresolved))
+
+    def test_finalize_all(self):
+        with pytest.raises(NameError):
+            instance.finalize_all()
+        instance.types.deferred_schemas.remove(Unresolved)
+        instance.finalize_all()
+        assert(instance.types.deferred_schemas == [])
+        assert(finalized(Model) and finalized(Keeper))
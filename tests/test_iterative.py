@@ -0,0 +1,114 @@
+"""
+MIT License
+
+Copyright (c) 2017 Brandon Hoffman
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from instance.types import *
+from instance.validators import ValidationException, MinLengthValidator
+import instance.iterative
+import pytest
+import typing
+from helpers import outcome
+
+class Leaf(Schema):
+    kind: str = "leaf"
+    value: int
+
+class Box(Schema):
+    kind: str = "box"
+    name: str
+    boxes: List['Box'] = []
+
+class Wrapper(Schema):
+    item: Union[Leaf, Box](discriminator="kind")
+
+class TreeNode(Schema):
+    name: String(validators=[MinLengthValidator(1)])
+    children: List['TreeNode'] = []
+    index: typing.Dict[str, 'TreeNode'] = {}
+    parent: typing.Optional['TreeNode'] = None
+    either: typing.Union[int, 'TreeNode'] = 0
+    wrapper: typing.Optional[Wrapper] = None
+
+class Person(Schema):
+    name: str
+    age: int
+
+def chain(depth):
+    payload = {'name': 'leaf'}
+    for _ in range(depth):
+        payload = {'name': 'node', 'children': [payload]}
+    return payload
+
+class TestIterative:
+    cases = [
+        {'name': 'a'},
+        {'name': 'a', 'children': [{'name': 'b', 'parent': {'name': 'c'}}], 'index': {'x': {'name': 'd'}}, 'either': {'name': 'e'}},
+        {'name': '', 'children': [{'name': 1}, {'name': 'b'}, None], 'index': {'x': {'name': ''}}},
+        {'name': 'a', 'children': 5, 'parent': {'name': None}, 'either': 'x'},
+        {'name': 'a', 'either': {'name': 'b', 'either': {'name': ''}}},
+        {'name': 'a', 'wrapper': {'item': {'kind': 'leaf', 'value': 1}}},
+        {'name': 'a', 'wrapper': {'item': {'kind': 'leaf', 'value': 'x'}}},
+        {'name': 'a', 'wrapper': {'item': {'kind': 'box', 'name': 'b', 'boxes': [{'name': 'c', 'boxes': [{'name': 1}]}]}}},
+        {'name': 'a', 'wrapper': {'item': {'kind': 'crate'}}},
+        {'name': 'a', 'wrapper': {'item': 1}},
+        {'name': 1, 'children': [{'name': ''}, {'name': 1}, {'name': None}], 'parent': {'name': 1}},
+    ]
+
+    def test_matches_recursive(self):
+        for case in self.cases:
+            for options in ({}, {'max_errors': 1}, {'max_errors': 2}):
+                assert(outcome(TreeNode.from_json, case, iterative=True, **options) == outcome(TreeNode.from_json, case, **options))
+                assert(TreeNode.check(case, iterative=True, **options) == TreeNode.check(case, **options))
+
+    def test_builds_schemas(self):
+        node = TreeNode.from_json({'name': 'a', 'children': [{'name': 'b'}], 'parent': {'name': 'p'}}, iterative=True)
+        assert(node.children == [{'name': 'b'}])
+        assert(node.parent == {'name': 'p'})
+        node.validate()
+        wrapper = Wrapper.from_json({'item': {'kind': 'leaf', 'value': 1}}, iterative=True)
+        assert(wrapper.item == {'kind': 'leaf', 'value': 1})
+
+    def test_deep_payload(self):
+        payload = chain(20000)
+        with pytest.raises(RecursionError):
+            TreeNode.from_json(payload)
+        node = TreeNode.from_json(payload, iterative=True)
+        assert(node.children[0]['name'] == 'node')
+        assert(TreeNode.check(payload, iterative=True) is None)
+
+    def test_deep_errors(self):
+        payload = chain(5000)
+        innermost = payload
+        while innermost.get('children'):
+            innermost = innermost['children'][0]
+        innermost['name'] = ''
+        error = TreeNode.check(payload, iterative=True)
+        for _ in range(5000):
+            error = error['children'][0]
+        assert(error == {'name': {'code': 6, 'message': 'value must have length <= 1'}, 'index': 0})
+
+    def test_flat_schemas_use_compiled(self):
+        assert(instance.iterative.node(Person.from_json) is None)
+        assert(instance.iterative.node(TreeNode.from_json) is not None)
+        with pytest.raises(ValidationException) as e:
+            Person.from_json({'name': 'a', 'age': 'b'}, iterative=True)
+        assert(e.value.error() == {'age': {'code': 2, 'message': 'unexpected type'}})
@@ -0,0 +1,113 @@
+"""
+MIT License
+
+Copyright (c) 2017 Brandon Hoffman
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from instance.types import *
+from instance.validators import *
+from instance.lazy import LazyList, LazyDict
+import typing
+
+class Person(Schema):
+    name: str
+    age: int
+
+class Team(Schema):
+    name: str
+    members: typing.List[Person]
+    roles: typing.Dict[str, Person] = {}
+    scores: typing.List[int] = []
+
+payload = {
+    'name': 'a-team',
+    'members': [{'name': 'Joe', 'age': 30}, {'name': 'Sue', 'age': 'x'}, {'name': 'Ann', 'age': 5}],
+    'roles': {'lead': {'name': 'Joe', 'age': 30}, 'cook': {'name': None, 'age': 1}},
+    'scores': [1, 2],
+}
+
+class TestLazy:
+    def test_proxies(self):
+        team = Team.from_json(payload, lazy=True)
+        assert isinstance(team.members, LazyList)
+        assert isinstance(team.roles, LazyDict)
+        assert team.scores == [1, 2]
+        assert len(team.members) == 3
+        assert team.members.items == [None, None, None]
+
+        first = team.members[0]
+        assert first.__class__ is Person
+        assert first.name == 'Joe'
+        assert team.members[0] is first
+        assert team.members.items[1] is None
+        assert [member.name for member in team.members[-1:]] == ['Ann']
+
+        assert sorted(team.roles) == ['cook', 'lead']
+        assert team.roles['lead'].age == 30
+        assert 'cook' not in team.roles.values
+
+    def test_errors_on_access(self):
+        team = Team.from_json(payload, lazy=True)
+        try:
+            team.members[1]
+            assert False
+        except ValidationException as e:
+            assert e.error() == {'age': {'code': 2, 'message': 'unexpected type'}}
+        try:
+            team.roles['cook']
+            assert False
+        except ValidationException as e:
+            assert e.error() == {'name': {'code': 1, 'message': 'None type not permitted'}}
+
+    def test_validate_all(self):
+        team = Team.from_json(payload, lazy=True)
+        team.members[0].age = 'old'
+        try:
+            team.members.validate_all()
+            assert False
+        except ValidationException as e:
+            assert e.error() == [
+                {'age': {'code': 2, 'message': 'unexpected type'}, 'index': 0},
+                {'age': {'code': 2, 'message': 'unexpected type'}, 'index': 1},
+            ]
+        try:
+            team.validate()
+            assert False
+        except ValidationException as e:
+            assert sorted(e.error()) == ['members', 'roles']
+
+        valid = Team.from_json({'name': 'b', 'members': [{'name': 'Joe', 'age': 1}]}, lazy=True)
+        valid.members.validate_all()
+        valid.validate()
+
+    def test_collection_validators_are_eager(self):
+        try:
+            Team.from_json({'name': 'a', 'members': None}, lazy=True)
+            assert False
+        except ValidationException as e:
+            assert e.error() == {'members': {'code': 1, 'message': 'None type not permitted'}}
+
+    def test_to_json(self):
+        team = Team.from_json(payload, lazy=True)
+        team.members[0].age = 31
+        json = team.to_json()
+        assert json['members'][0] == {'name': 'Joe', 'age': 31}
+        assert json['members'][1] == payload['members'][1]
+        assert json['roles'] == payload['roles']
@@ -0,0 +1,94 @@
+"""
+MIT License
+
+Copyright (c) 2017 Brandon Hoffman
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from instance.types import *
+from instance.validators import *
+import instance.metrics
+import typing
+from helpers import outcome, starts_capital
+
+class Driver(Schema):
+    name: String(validators=[starts_capital, MinLengthValidator(2)])
+    age: int = 30
+
+class Truck(Schema):
+    make: str
+    year: Integer(validators=[MinValidator(1950)])
+    driver: Driver
+    passengers: typing.List[Driver] = []
+
+cases = [
+    {'make': 'Volvo', 'year': 2000, 'driver': {'name': 'Joe'}, 'passengers': [{'name': 'Al'}]},
+    {'make': None, 'year': 1900, 'driver': {'name': 'joe'}, 'passengers': [{'name': 'a'}]},
+    None,
+]
+
+def measured(func):
+    instance.metrics.reset()
+    instance.metrics.enable()
+    try:
+        return func()
+    finally:
+        instance.metrics.disable()
+
+class TestMetrics:
+    def test_matches_compiled(self):
+        expected = [outcome(Truck.from_json, case) for case in cases] + [Truck.check(case) for case in cases[:2]]
+        results = measured(lambda: [outcome(Truck.from_json, case) for case in cases] + [Truck.check(case) for case in cases[:2]])
+        assert(results == expected)
+
+    def test_report(self):
+        measured(lambda: [outcome(Truck.from_json, case) for case in cases])
+        report = instance.metrics.report()
+        assert(report["test_metrics.Truck"]["calls"] == 3)
+        assert(report["test_metrics.Truck"]["failures"] == {1: 1, "nested": 1})
+        assert(report["test_metrics.Truck.make"]["calls"] == 2)
+        assert(report["test_metrics.Truck.make"]["failures"] == {1: 1})
+        assert(report["test_metrics.Truck.year"]["failures"] == {6: 1})
+        assert([validator["validator"] for validator in report["test_metrics.Truck.year"]["validators"]] == ["NoneTypeValidator", "TypesValidator", "MinValidator"])
+        assert(report["test_metrics.Truck.year"]["validators"][2]["calls"] == 2)
+        assert(report["test_metrics.Truck.driver"]["failures"] == {"nested": 1})
+        assert("validators" not in report["test_metrics.Truck.driver"])
+        assert(report["test_metrics.Driver"]["calls"] == 4)
+        assert(report["test_metrics.Driver.name"]["failures"] == {431: 2})
+        assert(report["test_metrics.Driver.name"]["validators"][2]["validator"] == "starts_capital")
+        assert(report["test_metrics.Driver.age"]["calls"] == 4)
+        assert(report["test_metrics.Truck.passengers"]["calls"] == 2)
+        assert(report["test_metrics.Truck"]["max"] <= report["test_metrics.Truck"]["time"])
+
+    def test_disabled(self):
+        measured(lambda: None)
+        Truck.from_json(cases[0])
+        assert(instance.metrics.report() == {})
+
+    def test_same_names(self):
+        def local():
+            class Driver(Schema):
+                name: str
+            return Driver
+
+        other = local()
+        measured(lambda: [Driver.check({'name': 'Joe'}), other.check({'name': 1})])
+        report = instance.metrics.report()
+        assert(report["test_metrics.Driver"]["failures"] == {})
+        assert(report["test_metrics.TestMetrics.test_same_names.<locals>.local.<locals>.Driver"]["failures"] == {"nested": 1})
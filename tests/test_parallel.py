@@ -0,0 +1,114 @@
+"""
+MIT License
+
+Copyright (c) 2017 Brandon Hoffman
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from instance.types import *
+from instance.validators import *
+import pickle
+import typing
+from helpers import starts_capital
+
+name = create_validated_type("name", str, [starts_capital])
+year = create_validated_type("year", Integer, [MinValidator(1950), MaxValidator(2017)])
+
+T = typing.TypeVar('T')
+
+class Person(Schema):
+    name: name
+    age: int
+
+class Car(Schema):
+    make: str
+    year: year
+    owner: Person
+    passengers: List[Person] = []
+    extras: Dictionary[str, typing.Union[int, str]] = {}
+
+class Box(Schema, typing.Generic[T]):
+    content: T
+
+class Nested:
+    class Wheel(Schema):
+        size: Double(validators=[MinValidator(10)])
+
+def roundtrip(obj):
+    for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+        copy = pickle.loads(pickle.dumps(obj, protocol))
+    return copy
+
+records = [
+    {'make': 'Toyota', 'year': 2007, 'owner': {'name': 'Joe', 'age': 30}, 'passengers': [{'name': 'Ann', 'age': 3}]},
+    {'make': 'Toyota', 'year': 1900, 'owner': {'name': 'joe', 'age': 30}},
+    {'make': 'Ford', 'year': 2010, 'owner': {'name': 'Sue', 'age': 40}, 'extras': {'seats': 5, 'color': 'red'}},
+]
+
+class TestPickle:
+    def test_types(self):
+        assert(roundtrip(Integer) is Integer)
+        assert(roundtrip(mapped_type(int)) is mapped_type(int))
+        assert(roundtrip(name) is name)
+        assert(roundtrip(mapped_type(name)) is mapped_type(name))
+        assert(roundtrip(Car.from_json) is Car.from_json)
+        assert(roundtrip(Nested.Wheel) is Nested.Wheel)
+        assert(roundtrip(Box[int]) == Box[int])
+
+        for type in Car.__annotations__.values():
+            copy = roundtrip(type)
+            assert(repr(copy) == repr(type))
+            assert(len(copy.all_validators) == len(type.all_validators))
+
+    def test_instances(self):
+        car = roundtrip(Car.from_json(records[0]))
+        assert(car.to_json()["owner"] == {'name': 'Joe', 'age': 30})
+        assert(car.__class__ is Car)
+
+        box = roundtrip(Box[int].from_json({'content': 1}))
+        assert(box.content == 1)
+        box.validate()
+
+    def test_old_protocols(self):
+        original = Car.from_json(records[0])
+        wheel = Nested.Wheel.from_json({'size': 12})
+        for protocol in (0, 1):
+            car = pickle.loads(pickle.dumps(original, protocol))
+            assert(car.to_json() == original.to_json())
+            car.validate()
+            assert(pickle.loads(pickle.dumps(wheel, protocol)).size == 12)
+
+    def test_errors(self):
+        try:
+            Car.from_json(records[1])
+            assert(False)
+        except ValidationException as e:
+            copy = roundtrip(e)
+            assert(copy.__class__ is SchemaValidationException)
+            assert(copy.error() == e.error())
+        copy = roundtrip(ValidationException(431, "Must start with capital letter"))
+        assert(copy.error() == {"code": 431, "message": "Must start with capital letter"})
+
+class TestFromJsonParallel:
+    def test_parallel(self):
+        objects, errors = Car.from_json_parallel(records * 5, workers=2, chunksize=2)
+        expected_objects, expected_errors = Car.from_json_many(records * 5)
+        assert([obj and obj.to_json() for obj in objects] == [obj and obj.to_json() for obj in expected_objects])
+        assert(errors == expected_errors)
+        assert(sorted(errors) == [1, 4, 7, 10, 13])
@@ -0,0 +1,104 @@
+"""
+MIT License
+
+Copyright (c) 2017 Brandon Hoffman
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from instance.types import *
+from instance.validators import *
+import typing
+from helpers import starts_capital
+
+class Engine(Schema):
+    power: Integer(validators=[MinValidator(1)])
+    fuel: str = "petrol"
+
+class Owner(Schema):
+    name: String(validators=[starts_capital])
+    age: int = 30
+
+class Car(Schema):
+    make: str
+    year: Integer(validators=[MinValidator(1950)])
+    owner: Owner
+    engine: Engine
+    passengers: typing.List[str] = []
+
+payload = {'make': 'Toyota', 'year': 2007, 'owner': {'name': 'Joe'}, 'engine': {'power': 90}}
+
+class TestApplyPatch:
+    def test_in_place(self):
+        car = Car.from_json(payload)
+        owner = car.owner
+        result = Car.apply_patch(car, {'year': 2010, 'owner': {'age': 40}, 'passengers': ['Ann'], 'color': 'red'})
+        assert result is car
+        assert car.owner is owner
+        assert car.to_json() == {
+            'make': 'Toyota', 'year': 2010, 'passengers': ['Ann'],
+            'owner': {'name': 'Joe', 'age': 40},
+            'engine': {'power': 90, 'fuel': 'petrol'},
+        }
+        assert not hasattr(car, "color")
+        car.validate(full=True)
+
+    def test_copy(self):
+        car = Car.from_json(payload)
+        copy = Car.apply_patch(car, {'owner': {'name': 'Sue'}}, copy=True)
+        assert copy is not car
+        assert copy.owner is not car.owner
+        assert copy.engine is car.engine
+        assert copy.owner.name == 'Sue'
+        assert car.owner.name == 'Joe'
+
+    def test_errors_leave_object_unchanged(self):
+        car = Car.from_json(payload)
+        before = car.to_json()
+        try:
+            Car.apply_patch(car, {'make': 'Ford', 'year': 1900, 'owner': {'name': 'sue', 'age': 40}, 'engine': {'power': 0}})
+            assert False
+        except SchemaValidationException as e:
+            assert e.error() == {
+                'year': {'code': 6, 'message': 'value must be <= 1950'},
+                'owner': {'name': {'code': 431, 'message': 'Must start with capital letter'}},
+                'engine': {'power': {'code': 6, 'message': 'value must be <= 1'}},
+            }
+        assert car.to_json() == before
+
+    def test_replace_nested(self):
+        car = Car()
+        car = Car.apply_patch(car, {'owner': {'name': 'Joe'}})
+        assert car.owner.to_json() == {'name': 'Joe', 'age': 30}
+        try:
+            Car.apply_patch(car, {'engine': {}})
+            assert False
+        except SchemaValidationException as e:
+            assert e.error() == {'engine': {'power': {'code': 1, 'message': 'None type not permitted'}}}
+
+    def test_keeps_validation_snapshot(self):
+        car = Car.from_json(payload)
+        car.make = None
+        Car.apply_patch(car, {'year': 2010, 'owner': {'age': 40}})
+        try:
+            car.validate()
+            assert False
+        except ValidationException as e:
+            assert list(e.error()) == ['make']
+        Car.apply_patch(car, {'make': 'Ford'})
+        car.validate()
@@ -0,0 +1,113 @@
+"""
+MIT License
+
+Copyright (c) 2017 Brandon Hoffman
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from instance.types import *
+from instance.validators import *
+import instance.projection
+import typing
+
+class Person(Schema):
+    name: String(validators=[MinLengthValidator(2)])
+    age: int
+
+class Car(Schema):
+    make: str
+    model: str
+    year: int
+    owner: Person
+    co_owner: typing.Optional[Person]
+    passengers: typing.List[Person] = []
+    garages: typing.Dict[str, Person] = {}
+
+payload = {
+    'make': 'Toyota',
+    'model': 1,
+    'owner': {'name': 'Joe', 'age': 'x'},
+    'co_owner': {'name': 'Sue', 'age': 'y'},
+    'passengers': [{'name': 'A', 'age': 3}, {'name': 'Ann', 'age': '4'}],
+    'garages': {'home': {'name': 'Bob', 'age': 'z'}},
+}
+
+def error(func):
+    try:
+        func()
+    except ValidationException as e:
+        return e.error()
+    assert False
+
+class TestProjection:
+    def test_parse(self):
+        tree = instance.projection.parse(frozenset(["make", "owner.name", "owner", "passengers[].age", "garages[][]"]))
+        assert tree == {"make": None, "owner": None, "passengers": {"[]": {"age": None}}, "garages": {"[]": {"[]": None}}}
+
+    def test_selected_fields(self):
+        car = Car.from_json(payload, fields={"make", "owner.name", "co_owner.name", "garages[].name"})
+        assert car.make == 'Toyota'
+        assert car.owner.name == 'Joe'
+        assert "age" not in car.owner.__dict__
+        assert "model" not in car.__dict__
+        assert car.co_owner is payload['co_owner']
+        assert car.garages is payload['garages']
+
+    def test_errors(self):
+        errors = error(lambda: Car.from_json(payload, fields={"model", "owner.age", "co_owner.name", "passengers[].age"}))
+        assert errors == {
+            'model': {'code': 2, 'message': 'unexpected type'},
+            'owner': {'age': {'code': 2, 'message': 'unexpected type'}},
+            'passengers': [{'age': {'code': 2, 'message': 'unexpected type'}, 'index': 1}],
+        }
+        errors = error(lambda: Car.from_json(payload, fields={"passengers[].name", "garages[].age", "year"}))
+        assert errors == {
+            'passengers': [{'name': {'code': 6, 'message': 'value must have length <= 2'}, 'index': 0}],
+            'garages': {'age': {'code': 2, 'message': 'unexpected type'}},
+            'year': {'code': 1, 'message': 'None type not permitted'},
+        }
+        errors = error(lambda: Car.from_json(payload, fields={"model", "owner.age"}, max_errors=1))
+        assert len(errors) == 1
+
+    def test_whole_fields(self):
+        errors = error(lambda: Car.from_json(payload, fields={"owner", "passengers", "owner.name"}))
+        assert errors == {
+            'owner': {'age': {'code': 2, 'message': 'unexpected type'}},
+            'passengers': [
+                {'name': {'code': 6, 'message': 'value must have length <= 2'}, 'index': 0},
+                {'age': {'code': 2, 'message': 'unexpected type'}, 'index': 1},
+            ],
+        }
+
+    def test_unknown_field(self):
+        failed = False
+        try:
+            Car.from_json(payload, fields={"owner.color"})
+        except ValueError:
+            failed = True
+        assert failed
+
+    def test_path_into_value(self):
+        for fields in ({"make.foo"}, {"passengers.name"}, {"passengers[][]"}, {"owner.name.first"}):
+            failed = False
+            try:
+                Car.from_json({}, fields=fields)
+            except ValueError:
+                failed = True
+            assert failed
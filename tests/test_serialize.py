@@ -0,0 +1,101 @@
+"""
+MIT License
+
+Copyright (c) 2017 Brandon Hoffman
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from instance.types import *
+from instance.validators import *
+import io
+import json
+import typing
+
+class Person(Schema):
+    name: str
+    age: int = 30
+
+class Team(Schema, slots=True):
+    name: str
+    lead: typing.Optional[Person]
+    members: typing.List[Person]
+    roles: typing.Dict[str, Person] = {}
+    tags: typing.List[str] = []
+
+payload = {
+    'name': 'a-team',
+    'lead': {'name': 'Joe'},
+    'members': [{'name': 'Sue', 'age': 40}, {'name': 'Ann'}],
+    'roles': {'cook': {'name': 'Bob', 'age': 50}},
+    'tags': ['x', 'y'],
+}
+
+expected = {
+    'name': 'a-team',
+    'lead': {'name': 'Joe'},
+    'members': [{'name': 'Sue', 'age': 40}, {'name': 'Ann', 'age': 30}],
+    'roles': {'cook': {'name': 'Bob', 'age': 50}},
+    'tags': ['x', 'y'],
+}
+
+def team():
+    team = Team.from_json(payload)
+    team.members = [Person.from_json(member) for member in payload['members']]
+    team.roles = {'cook': Person.from_json(payload['roles']['cook'])}
+    return team
+
+class TestToJson:
+    def test_nested_collections(self):
+        assert team().to_json() == expected
+
+    def test_plain_fields_are_shared(self):
+        obj = team()
+        assert obj.to_json()['tags'] is obj.tags
+
+    def test_lazy(self):
+        obj = Team.from_json(payload, lazy=True)
+        obj.members[0]
+        assert obj.to_json() == dict(payload, members=[{'name': 'Sue', 'age': 40}, {'name': 'Ann'}])
+        assert json.loads(obj.to_json_string()) == obj.to_json()
+
+    def test_missing_fields(self):
+        obj = Team()
+        obj.name = 'b'
+        assert obj.to_json() == {'name': 'b', 'lead': None, 'members': None, 'roles': {}, 'tags': []}
+
+class TestToJsonString:
+    def test_matches_dumps(self):
+        obj = team()
+        assert obj.to_json_string() == json.dumps(expected)
+        assert Person.from_json({'name': 'Joe'}).to_json_string() == '{"name": "Joe", "age": 30}'
+
+    def test_dump(self):
+        out = io.StringIO()
+        team().dump(out)
+        assert json.loads(out.getvalue()) == expected
+
+    def test_unserializable(self):
+        obj = team()
+        obj.tags = [object()]
+        failed = False
+        try:
+            obj.to_json_string()
+        except TypeError:
+            failed = True
+        assert failed
@@ -0,0 +1,88 @@
+"""
+MIT License
+
+Copyright (c) 2017 Brandon Hoffman
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from instance.types import *
+from instance.validators import ValidationException
+import pytest
+import typing
+from helpers import outcome
+
+class Node(Schema):
+    name: str
+    children: List['Node'] = []
+    parent: typing.Optional['Node'] = None
+
+class Pair(Schema):
+    left: Node
+    right: Node
+
+def diamond(depth):
+    node = {'name': 'leaf'}
+    for _ in range(depth):
+        node = {'name': 'node', 'children': [node, node], 'parent': node}
+    return node
+
+class TestShared:
+    cases = [
+        {'name': 'a', 'children': [{'name': 'b'}, {'name': 1}], 'parent': {'name': None}},
+        {'name': 'a', 'children': [{'name': 'b', 'children': [{'name': 2}]}]},
+        {'name': 'a', 'children': 5},
+    ]
+
+    def test_matches_unshared(self):
+        for case in self.cases:
+            for options in ({}, {'iterative': True}):
+                assert(outcome(Node.from_json, case, shared=True, **options) == outcome(Node.from_json, case))
+                assert(Node.check(case, shared=True, **options) == Node.check(case))
+
+    def test_validates_shared_values_once(self):
+        payload = diamond(60)
+        assert(Node.check(payload, shared=True) is None)
+        assert(Node.check(payload, shared=True, iterative=True) is None)
+        assert(Node.from_json(payload, shared=True).name == 'node')
+
+    def test_reuses_objects(self):
+        node = {'name': 'x'}
+        pair = Pair.from_json({'left': node, 'right': node}, shared=True)
+        assert(pair.left is pair.right)
+        pair = Pair.from_json({'left': node, 'right': node})
+        assert(pair.left is not pair.right)
+
+    def test_shared_errors(self):
+        node = {'name': 1}
+        errors = Node.check({'name': 'a', 'children': [node, node], 'parent': node}, shared=True)
+        assert(errors == {
+            'children': [{'name': {'code': 2, 'message': 'unexpected type'}, 'index': 0}, {'name': {'code': 2, 'message': 'unexpected type'}, 'index': 1}],
+            'parent': {'name': {'code': 2, 'message': 'unexpected type'}},
+        })
+
+    def test_cycles(self):
+        cycle = {'name': 'a'}
+        cycle['children'] = [cycle]
+        for options in ({}, {'iterative': True}):
+            with pytest.raises(ValidationException) as e:
+                Node.from_json(cycle, shared=True, **options)
+            assert(e.value.error() == {'children': [{'code': 7, 'message': 'cyclic reference', 'index': 0}]})
+        cycle = {'name': 'b'}
+        cycle['parent'] = cycle
+        assert(Pair.check({'left': {'name': 'a'}, 'right': cycle}, shared=True) == {'right': {'parent': {'code': 7, 'message': 'cyclic reference'}}})
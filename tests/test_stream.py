@@ -0,0 +1,136 @@
+"""
+MIT License
+
+Copyright (c) 2017 Brandon Hoffman
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from instance.types import *
+from instance.validators import *
+import instance.stream
+import io
+import json
+import mmap
+import tempfile
+
+class Car(Schema):
+    make: str
+    year: Integer(validators=[MinValidator(1950)])
+    passengers: List[str] = []
+
+records = [
+    {'make': 'Toyota', 'year': 2007, 'passengers': ["a", "b"]},
+    {'make': 'Ford', 'year': 1900},
+    {'make': "long \u00e9 name " * 50, 'year': 123456789012},
+    {'year': 2001.5},
+]
+
+def results(pairs):
+    output = []
+    for (index, result) in pairs:
+        if isinstance(result, ValidationException):
+            output.append((index, result.error()))
+        else:
+            output.append((index, result.to_json()))
+    return output
+
+def expected():
+    output = []
+    for (index, record) in enumerate(records):
+        try:
+            output.append((index, Car.from_json(record).to_json()))
+        except ValidationException as e:
+            output.append((index, e.error()))
+    return output
+
+class Counted(io.StringIO):
+    total = 0
+
+    def read(self, size=-1):
+        chunk = io.StringIO.read(self, size)
+        self.total += len(chunk)
+        return chunk
+
+class TestIterValidate:
+    ndjson = "\n".join(json.dumps(record, ensure_ascii=False) for record in records) + "\n\n"
+    array = " \n[" + ",\n ".join(json.dumps(record, ensure_ascii=False) for record in records) + "] "
+
+    def test_ndjson(self):
+        for chunk_size in (1, 7, 65536):
+            pairs = Car.iter_validate(io.StringIO(self.ndjson), chunk_size=chunk_size)
+            assert(results(pairs) == expected())
+
+    def test_array(self):
+        for chunk_size in (1, 7, 65536):
+            pairs = Car.iter_validate(io.BytesIO(self.array.encode("utf-8")), chunk_size=chunk_size)
+            assert(results(pairs) == expected())
+
+    def test_mmap(self):
+        with tempfile.TemporaryFile() as f:
+            f.write(self.array.encode("utf-8"))
+            f.flush()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                assert(results(Car.iter_validate(mapped)) == expected())
+
+    def test_lazy(self):
+        pairs = Car.iter_validate(io.StringIO(self.ndjson + "{not json}\n"))
+        assert(next(pairs)[0] == 0)
+        output = list(pairs)
+        assert(len(output) == len(records))
+        assert(output[-1][1].error() == {"code": 3, "message": "invalid json"})
+
+    def test_empty(self):
+        assert(list(Car.iter_validate(io.StringIO("  "))) == [])
+        assert(list(Car.iter_validate(io.StringIO("[ ]"))) == [])
+
+    def test_invalid_array(self):
+        failed = False
+        try:
+            list(Car.iter_validate(io.StringIO('[{"make": "a"} {"make": "b"}]')))
+        except ValueError:
+            failed = True
+        assert(failed)
+
+    def test_invalid_element(self):
+        bad = ['{"make": "x", "year": }', '{"make": "a, ]\\" }", "year": 2000]', '[1, 2}', 'nul']
+        source = Counted("[" + ",".join([json.dumps(records[0])] + bad + [json.dumps(records[0])] * 1000) + "]")
+        pairs = Car.iter_validate(source, chunk_size=64)
+        assert(next(pairs)[0] == 0)
+        for index in range(1, 5):
+            assert(next(pairs)[1].error() == {"code": 3, "message": "invalid json"})
+        assert(source.total < 1024)
+        output = list(pairs)
+        assert(len(output) == 1000)
+        assert(output[-1][0] == 1004)
+        assert(not [result for (index, result) in output if isinstance(result, ValidationException)])
+
+    def test_numbers(self):
+        values = list(instance.stream.iter_values(io.StringIO("[1, 22.5e3 ,-333]"), chunk_size=1))
+        assert(values == [1, 22.5e3, -333])
+
+    def test_non_object_records(self):
+        source = '{"make": "a", "year": 2000}\n5\ntrue\n"x"\n[1]\n{"make": "b", "year": 2001}\n'
+        output = results(Car.iter_validate(io.StringIO(source)))
+        assert(output[0] == (0, {'make': 'a', 'year': 2000, 'passengers': []}))
+        assert(output[1:5] == [(index, {"code": 2, "message": "unexpected type"}) for index in range(1, 5)])
+        assert(output[5] == (5, {'make': 'b', 'year': 2001, 'passengers': []}))
+        output = results(Car.iter_validate(io.StringIO('[5, null, {"make": "c", "year": 2002}]')))
+        assert(output[0] == (0, {"code": 2, "message": "unexpected type"}))
+        assert(output[1] == (1, {"code": 1, "message": "None type not permitted"}))
+        assert(output[2][0] == 2)
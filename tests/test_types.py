@@ -23,6 +23,9 @@ SOFTWARE.
 """
 from instance.types import *
 from instance.types import SchemaType
+from instance.validators import ValidationException, Validator, MinValidator, MaxValidator
+import collections
+import json
 import typing
 
 class TestInteger:
@@ -336,6 +339,12 @@ class TestGenericSchema:
         assert TestGenericSchema.GenericTestSchema[int].__annotations__["x"].__class__ == Integer
         assert TestGenericSchema.GenericTestSchema[int].__annotations__["y"].__class__ == List[Integer]
 
+    def test_from_json(self):
+        obj = TestGenericSchema.GenericTestSchema[int].from_json({'x': 1, 'y': [2]})
+        assert obj.x == 1
+        assert obj.y == [2]
+        assert TestGenericSchema.GenericTestSchema.from_json.schema is TestGenericSchema.GenericTestSchema
+
     def test_subclass_generic(self):
         class Gen2(TestGenericSchema.GenericTestSchema[int]):
             pass
@@ -355,3 +364,569 @@ class TestGenericSchema:
         assert Gen2[float].__annotations__["x"].__class__ == Integer
         assert Gen2[float].__annotations__["y"].__class__ == List[Integer]
         assert Gen2[float].__annotations__["z"].__class__ == Double
+
+class Person(Schema):
+    name: str
+    age: int = 30
+
+    def __init__(self):
+        Person.built += 1
+
+Person.built = 0
+
+class Garage(Schema):
+    make: str
+    owner: Person
+    passengers: List[Person] = []
+    seats: Dictionary[str, Person] = {}
+    co_owner: typing.Optional[Person]
+
+class TestValidateOnly:
+    def test_success(self):
+        Person.built = 0
+        assert Garage.check({
+                'make': 'test',
+                'owner': {'name': 'joe'},
+                'passengers': [{'name': 'ann', 'age': 3}],
+                'seats': {'front': {'name': 'bob'}},
+                'co_owner': None,
+            }) is None
+        assert Person.built == 0
+
+    def test_nested_errors(self):
+        errors = Garage.check({
+                'make': 1,
+                'owner': {'name': 'joe', 'age': '30'},
+                'passengers': [{'name': 'ann'}, {'name': None}],
+                'seats': {'front': {}},
+                'co_owner': {'name': 'sue'},
+            })
+        assert errors["make"] == {"code": 2, "message": "unexpected type"}
+        assert errors["owner"] == {"age": {"code": 2, "message": "unexpected type"}}
+        assert errors["passengers"] == [{"name": {"code": 1, "message": "None type not permitted"}, "index": 1}]
+        assert errors["seats"] == {"name": {"code": 1, "message": "None type not permitted"}}
+        assert "co_owner" not in errors
+
+        failed = False
+        try:
+            Garage.from_json.validate_only({'make': 'test'})
+        except ValidationException as e:
+            failed = e.error()["owner"] == {"code": 1, "message": "None type not permitted"}
+        assert failed
+
+    def test_not_an_object(self):
+        for payload in (5, True, "make x", [1], 1.5):
+            assert Garage.check(payload) == {"code": 2, "message": "unexpected type"}
+        errors = Garage.check({'make': 'test', 'owner': 'joe', 'passengers': [1]})
+        assert errors["owner"] == {"code": 2, "message": "unexpected type"}
+        assert errors["passengers"] == [{"code": 2, "message": "unexpected type", "index": 0}]
+
+    def test_dict_subclass(self):
+        payload = json.loads('{"make": "test", "owner": {"name": "joe"}}', object_pairs_hook=collections.OrderedDict)
+        assert Garage.check(payload) is None
+        assert Garage.check(payload, iterative=True) is None
+        assert Garage.from_json(payload).owner.name == "joe"
+
+class Roster(Schema):
+    team: str
+    members: List[Person]
+    scores: Dictionary[str, Person] = {}
+    captain: typing.Union[int, Person] = 1
+
+def count_errors(error):
+    if isinstance(error, list):
+        return sum(count_errors(e) for e in error)
+    if "code" in error:
+        return 1
+    return sum(count_errors(e) for (key, e) in error.items() if key != "index")
+
+class TestMaxErrors:
+    payload = {
+        'team': 1,
+        'members': [{'name': None, 'age': 'x'} for _ in range(1000)],
+    }
+
+    def errors(self, **options):
+        try:
+            Roster.from_json(self.payload, **options)
+        except ValidationException as e:
+            return e.error()
+        assert False
+
+    def test_unbounded(self):
+        errors = self.errors()
+        assert count_errors(errors) == 2001
+        assert len(errors["members"]) == 1000
+
+    def test_fail_fast(self):
+        errors = self.errors(max_errors=1)
+        assert errors == {"team": {"code": 2, "message": "unexpected type"}}
+
+    def test_budget(self):
+        errors = self.errors(max_errors=4)
+        assert count_errors(errors) == 4
+        assert len(errors["members"]) == 2
+        assert errors["members"][1] == {"name": {"code": 1, "message": "None type not permitted"}, "index": 1}
+
+        errors = Roster.check(self.payload, max_errors=4)
+        assert count_errors(errors) == 4
+
+    def test_dictionary_and_union(self):
+        payload = {
+            'team': 'a',
+            'members': [],
+            'scores': {'x': {'name': None, 'age': None}},
+            'captain': {'name': None, 'age': None},
+        }
+        try:
+            Roster.from_json(payload, max_errors=1)
+            assert False
+        except ValidationException as e:
+            assert e.error() == {"scores": {"name": {"code": 1, "message": "None type not permitted"}}}
+
+        del payload['scores']
+        try:
+            Roster.from_json(payload, max_errors=1)
+            assert False
+        except ValidationException as e:
+            assert e.error() == {"captain": [
+                {"code": 2, "message": "unexpected type"},
+                {"name": {"code": 1, "message": "None type not permitted"}},
+            ]}
+
+    def test_non_object_elements(self):
+        payload = {'team': 'a', 'members': [1, {'name': 'joe'}, 'x'], 'scores': {'x': []}}
+        try:
+            Roster.from_json(payload)
+            assert False
+        except ValidationException as e:
+            assert e.error() == {
+                "members": [
+                    {"code": 2, "message": "unexpected type", "index": 0},
+                    {"code": 2, "message": "unexpected type", "index": 2},
+                ],
+                "scores": {"code": 2, "message": "unexpected type"},
+            }
+        assert Roster.check(payload, max_errors=1) == {"members": [{"code": 2, "message": "unexpected type", "index": 0}]}
+
+class TestSlots:
+    class Car(Schema, slots=True):
+        make: str = "Toyota"
+        model: str
+        year: int
+        passengers: List[str] = []
+
+    class ElectricCar(Car, slots=True):
+        year: int = 2017
+        battery_size: int
+
+    class SlotGeneric(Schema, typing.Generic[T], slots=True):
+        x: T = 1
+
+    def test_no_dict(self):
+        car = TestSlots.Car.from_json({'model': 'Corolla', 'year': 2007})
+        assert not hasattr(car, "__dict__")
+        assert TestSlots.Car.__slots__ == ('make', 'model', 'year', 'passengers')
+        assert car.make == "Toyota"
+        assert car.model == "Corolla"
+        assert car.passengers == []
+        car.validate()
+        assert car.to_json() == {'make': 'Toyota', 'model': 'Corolla', 'year': 2007, 'passengers': []}
+
+        failed = False
+        try:
+            car.color = "red"
+        except AttributeError:
+            failed = True
+        assert failed
+
+    def test_constructed_defaults(self):
+        car = TestSlots.ElectricCar()
+        assert car.make == "Toyota"
+        assert car.year == 2017
+        assert car.passengers == []
+        car.model = "Leaf"
+        car.battery_size = 40
+        car.validate()
+        assert car.to_json() == {'make': 'Toyota', 'model': 'Leaf', 'year': 2017, 'passengers': [], 'battery_size': 40}
+
+    def test_custom_init(self):
+        class Tracked(Schema):
+            make: str = "Toyota"
+
+            def __init__(self):
+                self.created = True
+
+        class SlotTracked(Tracked, slots=True):
+            year: int = 2000
+
+        for cls in (Tracked, SlotTracked):
+            assert cls.__init__ is Tracked.__init__
+            assert cls.from_json({}).created
+            assert cls.from_json({}, fields={"make"}).created
+            assert cls.from_json({}, iterative=True).created
+
+    def test_subclass(self):
+        car = TestSlots.ElectricCar.from_json({'model': 'Leaf', 'battery_size': 40})
+        assert not hasattr(car, "__dict__")
+        assert TestSlots.ElectricCar.__slots__ == ('battery_size',)
+        assert car.make == "Toyota"
+        assert car.year == 2017
+        assert car.battery_size == 40
+
+        class Plain(TestSlots.Car):
+            make: str = "Ford"
+            color: str = "red"
+
+        car = Plain.from_json({'model': 'Corolla', 'year': 2007})
+        assert car.color == "red"
+        assert car.make == "Ford"
+        assert car.passengers == []
+
+    def test_generic(self):
+        obj = TestSlots.SlotGeneric[int].from_json({})
+        assert obj.x == 1
+        assert not hasattr(obj, "__dict__")
+
+    def test_check_and_interpret(self):
+        assert TestSlots.Car.check({'model': 'Corolla', 'year': 2007}) is None
+        car = TestSlots.Car.from_json.interpret({'model': 'Corolla', 'year': 2007})
+        assert car.make == "Toyota"
+
+class TestInterning:
+    def test_parameterized_classes(self):
+        assert List[int] is List[Integer]
+        assert Dictionary[str, typing.List[int]] is Dictionary[String, List[Integer]]
+        assert TestGenericSchema.GenericTestSchema[int] is TestGenericSchema.GenericTestSchema[Integer]
+
+    def test_instances(self):
+        assert mapped_type(typing.List[int]) is mapped_type(typing.List[int])
+        assert mapped_type(typing.List[int]) is mapped_type(List[Integer])
+        assert mapped_type(typing.Dict[str, int]) is mapped_type(typing.Dict[str, int])
+
+        class A(Schema):
+            x: typing.List[str]
+            y: typing.Optional[int]
+
+        class B(Schema):
+            x: typing.List[str]
+            y: typing.Optional[int]
+
+        assert A.__annotations__["x"] is B.__annotations__["x"]
+        assert A.__annotations__["y"] is B.__annotations__["y"]
+
+    def test_validators_identity(self):
+        def test_validator(val):
+            pass
+
+        validated = create_validated_type('validated_list', typing.List[int], validators=[test_validator])
+        assert mapped_type(validated) is not mapped_type(typing.List[int])
+        assert mapped_type(validated).__class__.__origin__ is None
+
+class TestCheck:
+    def test_returns_errors(self):
+        assert mapped_type(int).check(1) is None
+        error = mapped_type(int).check("1")
+        assert isinstance(error, ValidationException)
+        assert error.error() == {"code": 2, "message": "unexpected type"}
+
+        error = mapped_type(typing.List[int]).check([1, "2", 3, None])
+        assert error.error() == [
+            {"code": 2, "message": "unexpected type", "index": 1},
+            {"code": 1, "message": "None type not permitted", "index": 3},
+        ]
+        assert mapped_type(typing.Union[int, str]).check("a") is None
+        assert len(mapped_type(typing.Union[int, str]).check(1.0).error()) == 2
+        assert mapped_type(typing.Optional[int]).check(None) is None
+
+    def test_raising_validators(self):
+        def starts_capital(val):
+            if not val[0].isupper():
+                raise ValidationException(431, "Must start with capital letter")
+
+        class Even(Validator):
+            def __call__(self, val):
+                if val % 2:
+                    raise ValidationException(432, "must be even")
+
+        assert String(validators=[starts_capital]).check("joe").error()["code"] == 431
+        assert String(validators=[starts_capital]).check("Joe") is None
+        assert Integer(validators=[Even()]).check(3).error()["code"] == 432
+        assert Integer(validators=[Even()]).check(4) is None
+
+    def test_custom_validate(self):
+        class Positive(Integer):
+            def validate(self, _val, ctx=None):
+                super(Positive, self).validate(_val, ctx)
+                if _val <= 0:
+                    raise ValidationException(433, "must be positive")
+                return _val
+
+        class Account(Schema):
+            balance: Positive()
+
+        assert Positive().check(-1).error()["code"] == 433
+        assert Account.check({'balance': -1}) == {"balance": {"code": 433, "message": "must be positive"}}
+        assert Account.check({'balance': 1}) is None
+
+    def test_validate_without_context(self):
+        class Odd(Integer):
+            def validate(self, _val):
+                super(Odd, self).validate(_val)
+                if not _val % 2:
+                    raise ValidationException(99, "must be odd")
+                return _val
+
+        class Counter(Schema):
+            n: Odd()
+
+        assert Counter.from_json({'n': 3}).n == 3
+        try:
+            Counter.from_json({'n': 2})
+            assert False
+        except ValidationException as e:
+            assert e.error() == {'n': {'code': 99, 'message': 'must be odd'}}
+        assert Counter.check({'n': 2}, max_errors=1) == {'n': {'code': 99, 'message': 'must be odd'}}
+        assert Odd()(5) == 5
+
+class TestTaggedUnion:
+    class Click(Schema):
+        type: str = "click"
+        x: int
+
+    class Key(Schema):
+        type: str = "key"
+        code: str
+
+    class Scroll(Schema):
+        type: str = "scroll"
+        delta: float
+
+    def test_n_ary(self):
+        union = mapped_type(typing.Union[int, str, float, TestTaggedUnion.Click])
+        assert repr(union) == "Union<Integer, String, Double, <SchemaType[{schema}]>>".format(schema=TestTaggedUnion.Click)
+        assert union.check(1) is None
+        assert union.check("a") is None
+        assert union.check(1.5) is None
+        assert union.check({'x': 1}) is None
+        assert union.dispatch[str] == (union.branches[1], union.branches[3])
+        assert len(union.check([]).error()) == 4
+
+    def test_discriminator(self):
+        events = Union[TestTaggedUnion.Click, TestTaggedUnion.Key, TestTaggedUnion.Scroll](discriminator="type")
+        assert set(events.tags) == {"click", "key", "scroll"}
+        assert events.check({'type': 'key', 'code': 'a'}) is None
+        assert events.check({'type': 'key', 'code': 1}).error() == {"code": {"code": 2, "message": "unexpected type"}}
+        assert events.check({'type': 'drag'}).error() == {"code": 4, "message": "unknown type value"}
+        assert events.check([]).error() == {"code": 2, "message": "unexpected type"}
+
+        class Log(Schema):
+            entries: List[events]
+
+        assert Log.check({'entries': [{'type': 'click', 'x': 1}, {'type': 'scroll', 'delta': 0.5}]}) is None
+        errors = Log.check({'entries': [{'type': 'click', 'x': 'a'}]})
+        assert errors == {"entries": [{"x": {"code": 2, "message": "unexpected type"}, "index": 0}]}
+
+    def test_discriminator_requires_schemas(self):
+        failed = False
+        try:
+            Union[TestTaggedUnion.Click, int](discriminator="type")
+        except TypeError:
+            failed = True
+        assert failed
+
+    def test_unhashable_tag(self):
+        events = Union[TestTaggedUnion.Click, TestTaggedUnion.Key](discriminator="type")
+        assert events.check({'type': ['click']}).error() == {"code": 4, "message": "unknown type value"}
+
+        class Log(Schema):
+            entry: events
+
+        expected = {"entry": {"code": 4, "message": "unknown type value"}}
+        assert Log.check({'entry': {'type': {}}}) == expected
+        assert Log.check({'entry': {'type': {}}}, iterative=True) == expected
+
+    def test_ambiguous_tags(self):
+        class Tap(Schema):
+            type: str = "click"
+            x: int
+
+        class Untagged(Schema):
+            x: int
+
+        for branches in ((TestTaggedUnion.Click, Tap), (TestTaggedUnion.Click, Untagged)):
+            failed = False
+            try:
+                Union[branches](discriminator="type")
+            except TypeError:
+                failed = True
+            assert failed
+
+    def test_none_anywhere(self):
+        for generic in (typing.Union[int, None, str], typing.Union[None, int, str], typing.Union[None, int]):
+            union = mapped_type(generic)
+            assert isinstance(union, Optional)
+            assert union.check(None) is None
+            assert union.check(1) is None
+        assert mapped_type(typing.Union[int, None, str]).check("a") is None
+        assert len(mapped_type(typing.Union[int, None, str]).check(1.5).error()) == 2
+
+    def test_failed_candidates_checked_once(self):
+        calls = []
+
+        class Odd(Validator):
+            def __call__(self, val):
+                calls.append(val)
+                if not val % 2:
+                    raise ValidationException(432, "must be odd")
+
+        union = Union[Integer(validators=[Odd()]), String]()
+        assert union.check(2).error() == [{"code": 432, "message": "must be odd"}, {"code": 2, "message": "unexpected type"}]
+        assert calls == [2]
+
+class TestValidatorChain:
+    def test_stacked_types(self):
+        year = create_validated_type("chain_year", Integer, [MinValidator(1950)])
+        recent = create_validated_type("chain_recent", year, [MaxValidator(2017), MinValidator(1950)])
+        type = mapped_type(recent)
+        assert len(type.validators) == 3
+        assert len(type.all_validators) == 3
+        assert type.inline_validators() is type.all_validators
+        assert type.check(1949).error() == {"code": 6, "message": "value must be <= 1950"}
+        assert type.check(2018).error() == {"code": 6, "message": "value must be >= 2017"}
+        assert type.check(None).error() == {"code": 1, "message": "None type not permitted"}
+        assert type.check(2000) is None
+
+class TestCache:
+    def test_memoized(self):
+        calls = []
+        def counted(val):
+            calls.append(val)
+            if not val[0].isupper():
+                raise ValidationException(431, "Must start with capital letter")
+
+        type = String(validators=[counted], cache=2)
+        assert type.inline_validators() is None
+        for val in ["Joe", "Joe", "sue", "Joe", "sue"]:
+            type.check(val)
+        assert calls == ["Joe", "sue"]
+        assert type.check("sue").error()["code"] == 431
+        info = type.cache_info()
+        assert (info.hits, info.misses, info.maxsize, info.currsize) == (4, 2, 2, 2)
+
+        type.check("Ann")
+        type.check("Joe")
+        assert calls == ["Joe", "sue", "Ann", "Joe"]
+
+        type.cache_clear()
+        assert type.cache_info().currsize == 0
+        assert String().cache_info() is None
+
+    def test_typed_and_unhashable(self):
+        type = Integer(cache=16)
+        assert type.check(1) is None
+        assert type.check(True).error()["code"] == 2
+        assert type.check(1.0).error()["code"] == 2
+        assert type.cache_info().misses == 3
+        assert type.check([1]).error()["code"] == 2
+        assert type.cache_info().currsize == 3
+
+    def test_schema_field(self):
+        country_code = create_validated_type("cached_code", str, [MaxValidator("ZZ")], cache=128)
+
+        class Country(Schema):
+            code: country_code
+            codes: List[country_code] = []
+
+        assert Country.check({'code': 'NL', 'codes': ['NL', 'NL', 'DE']}) is None
+        assert Country.check({'code': 'zz'}) == {"code": {"code": 6, "message": "value must be >= ZZ"}}
+        info = mapped_type(country_code).cache_info()
+        assert (info.hits, info.misses) == (2, 3)
+
+    def test_union(self):
+        def short(val):
+            if len(str(val)) > 3:
+                raise ValidationException(434, "too long")
+
+        code = create_validated_type("cached_union", typing.Union[int, str], [short], cache=8)
+        type = mapped_type(code)
+        assert type.check(12) is None
+        assert type.check("ab") is None
+        assert type.check("abcd").error()["code"] == 434
+        assert len(type.check(1.5).error()) == 2
+        type.check(12)
+        assert type.cache_info().hits == 1
+
+calls = []
+
+def counted(val):
+    calls.append(val)
+
+class DirtyOwner(Schema):
+    name: String(validators=[counted])
+
+class DirtyCar(Schema):
+    make: String(validators=[counted])
+    year: int
+    owner: DirtyOwner
+
+class DirtySlotCar(DirtyCar, slots=True):
+    pass
+
+class TestDirtyValidation:
+    def test_only_changed_fields(self):
+        for cls in (DirtyCar, DirtySlotCar):
+            car = cls.from_json({'make': 'Toyota', 'year': 2007, 'owner': {'name': 'Joe'}})
+            del calls[:]
+            car.validate()
+            assert calls == []
+
+            car.make = "Ford"
+            car.owner.name = "Sue"
+            car.validate()
+            assert calls == ["Ford", "Sue"]
+            car.validate()
+            assert calls == ["Ford", "Sue"]
+
+            car.validate(full=True)
+            assert calls == ["Ford", "Sue", "Ford", "Sue"]
+
+            car.year = "2007"
+            car.owner.name = None
+            try:
+                car.validate()
+                assert False
+            except ValidationException as e:
+                assert e.error() == {
+                    "year": {"code": 2, "message": "unexpected type"},
+                    "owner": {"name": {"code": 1, "message": "None type not permitted"}},
+                }
+            car.year = 2007
+            try:
+                car.validate()
+                assert False
+            except ValidationException as e:
+                assert list(e.error()) == ["owner"]
+
+    def test_in_place_changes(self):
+        garage = TestSlots.Car.from_json({'model': 'Corolla', 'year': 2007, 'passengers': ['a']})
+        garage.validate()
+        garage.passengers.append(None)
+        try:
+            garage.validate()
+            assert False
+        except ValidationException as e:
+            assert e.error() == {"passengers": [{"code": 1, "message": "None type not permitted", "index": 1}]}
+
+    def test_unvalidated_objects(self):
+        car = DirtyCar()
+        try:
+            car.validate()
+            assert False
+        except ValidationException as e:
+            assert sorted(e.error()) == ["make", "owner", "year"]
+
+        cars, errors = DirtyCar.from_json_many([{'make': 'Toyota', 'year': 2007, 'owner': {'name': 'Joe'}}])
+        del calls[:]
+        cars[0].validate()
+        assert calls == []
@@ -93,3 +93,48 @@ class TestMinLengthValidator2(TestValidator):
     validator = MinLengthValidator(1)
     success_cases = [[1, 2], [1]]
     failure_cases = [[]]
+
+class TestRangeValidator(TestValidator):
+    validator = RangeValidator(MinValidator(1), MaxValidator(10, inclusive=False))
+    success_cases = [1, 5]
+    failure_cases = [0, 10, 11]
+
+class TestLengthRangeValidator(TestValidator):
+    validator = LengthRangeValidator(MinLengthValidator(1), MaxLengthValidator(2))
+    success_cases = [[1], [1, 2]]
+    failure_cases = [[], [1, 2, 3]]
+
+class TestOptimize:
+    def test_dedupe(self):
+        def custom(val):
+            pass
+
+        none = NoneTypeValidator()
+        chain = optimize([none, TypesValidator((int,)), custom, NoneTypeValidator(), TypesValidator((int,)), custom, TypesValidator((str,))])
+        assert chain[0] is none
+        assert [validator.__class__ for validator in chain] == [NoneTypeValidator, TypesValidator, custom.__class__, TypesValidator]
+
+    def test_fuse(self):
+        minimum, maximum = MinValidator(1950), MaxValidator(2017)
+        chain = optimize([NoneTypeValidator(), maximum, minimum, MinValidator(1950)])
+        assert len(chain) == 2
+        assert chain[1].__class__ is RangeValidator
+        assert chain[1].parts() == (minimum, maximum)
+        assert expand(chain)[1:] == [minimum, maximum]
+        assert chain[1].check(1949) is minimum.exception
+        assert chain[1].check(2018) is maximum.exception
+
+        chain = optimize([MinLengthValidator(2), MaxLengthValidator(8)])
+        assert [validator.__class__ for validator in chain] == [LengthRangeValidator]
+
+    def test_overlapping_not_fused(self):
+        chain = optimize([MinValidator(10), MaxValidator(5)])
+        assert [validator.__class__ for validator in chain] == [MinValidator, MaxValidator]
+        chain = optimize([MaxValidator(5, inclusive=False), MinValidator(5)])
+        assert [validator.__class__ for validator in chain] == [MaxValidator, MinValidator]
+        chain = optimize([MinValidator(1), starts_with_a, MaxValidator(5)])
+        assert len(chain) == 3
+
+def starts_with_a(val):
+    if not val.startswith("a"):
+        raise ValidationException(431, "must start with a")